@@ -0,0 +1,90 @@
+"""
+Reports the import cost of the modules loaded by an import, from `-X importtime`.
+
+Each run imports the module in a fresh interpreter, the lowest time of every
+module over the runs is kept to smooth out noise. Exits with status 1 when
+the total exceeds the budget, so it can guard startup time in CI.
+
+Usage (from `server/`):
+    python -m benchmarks.import_time --module src.server --top 20
+    python -m benchmarks.import_time --module src.core.database --budget-ms 400
+"""
+
+import sys
+import argparse
+import subprocess
+from dataclasses import dataclass
+
+
+@dataclass
+class ImportCost:
+    """Import time of one module, in microseconds."""
+
+    name: str
+    self_us: int
+    cumulative_us: int
+
+
+def _measure(module: str) -> dict[str, ImportCost]:
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    costs = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+
+        self_us, cumulative_us, name = line.removeprefix('import time:').split('|')
+        name = name.strip()
+        costs[name] = ImportCost(name, int(self_us), int(cumulative_us))
+
+    return costs
+
+
+def main(module: str, top: int, runs: int, prefix: str, budget_ms: float | None) -> int:
+    best: dict[str, ImportCost] = {}
+    for _ in range(runs):
+        for name, cost in _measure(module).items():
+            if name not in best or cost.cumulative_us < best[name].cumulative_us:
+                best[name] = cost
+
+    total_ms = best[module].cumulative_us / 1000
+
+    print(f'{"module":<48} {"self ms":>10} {"cumulative ms":>14}')
+    for cost in sorted(best.values(), key=lambda c: c.cumulative_us, reverse=True)[
+        :top
+    ]:
+        print(
+            f'{cost.name:<48} {cost.self_us / 1000:>10.1f} '
+            f'{cost.cumulative_us / 1000:>14.1f}'
+        )
+
+    own = [cost for name, cost in best.items() if name.startswith(prefix)]
+    print()
+    print(f'{len(best)} modules imported, {len(own)} from {prefix}*')
+    print(
+        f'{prefix}* modules: {sum(c.self_us for c in own) / 1000:.1f}ms of their own code'
+    )
+    print(f'Total import of {module}: {total_ms:.1f}ms')
+
+    if budget_ms is not None and total_ms > budget_ms:
+        print(f'Over budget by {total_ms - budget_ms:.1f}ms ({budget_ms:.0f}ms).')
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Report import time per module.')
+    parser.add_argument('--module', default='src.server')
+    parser.add_argument('--top', type=int, default=25)
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--prefix', default='src.', help='Prefix of the app modules.')
+    parser.add_argument('--budget-ms', type=float, help='Fails above this total.')
+    args = parser.parse_args()
+
+    sys.exit(main(args.module, args.top, args.runs, args.prefix, args.budget_ms))
@@ -0,0 +1,91 @@
+"""
+Compares throughput of the user read endpoints with and without the DTO response path.
+
+Requests go through the ASGI app in process, so the numbers measure the
+framework overhead: authentication is served by the token cache and users by
+the user cache after the first request.
+
+Usage (from `server/`, against the database configured in `.env`):
+    python -m benchmarks.responses --requests 5000 --concurrency 20
+"""
+
+import time
+import asyncio
+import argparse
+from uuid import uuid4
+from httpx import ASGITransport, AsyncClient
+
+from src.server import api
+from src.core.config import settings
+from src.core.database import sessionmanager
+
+
+async def _throughput(
+    client: AsyncClient,
+    url: str,
+    headers: dict[str, str],
+    requests: int,
+    concurrency: int,
+) -> float:
+    async def worker(count: int) -> None:
+        for _ in range(count):
+            response = await client.get(url, headers=headers)
+            response.raise_for_status()
+
+    # Warms up the caches.
+    await worker(10)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(requests // concurrency) for _ in range(concurrency)))
+    return requests // concurrency * concurrency / (time.perf_counter() - start)
+
+
+async def main(requests: int, concurrency: int) -> None:
+    sessionmanager.init(settings.DB_URL)
+
+    transport = ASGITransport(app=api)
+    async with AsyncClient(transport=transport, base_url='http://bench') as client:
+        name = f'bench_{uuid4().hex[:12]}'
+        response = await client.post(
+            '/users/',
+            json={
+                'username': name,
+                'email': f'{name}@example.com',
+                'firstName': 'Bench',
+                'lastName': 'User',
+                'password': 'bench1',
+            },
+        )
+        user_id = response.json()['id']
+
+        response = await client.post(
+            '/auth/login', data={'username': name, 'password': 'bench1'}
+        )
+        headers = {'Authorization': f'Bearer {response.json()["accessToken"]}'}
+
+        print(f'{"endpoint":<20} {"validated req/s":>16} {"direct req/s":>14}')
+        for label, url in (
+            ('/users/me', '/users/me'),
+            ('/users/{user_id}', f'/users/{user_id}'),
+        ):
+            results = []
+            for enabled in (False, True):
+                settings.DTO_RESPONSES_ENABLED = enabled
+                results.append(
+                    await _throughput(client, url, headers, requests, concurrency)
+                )
+
+            print(f'{label:<20} {results[0]:>16.0f} {results[1]:>14.0f}')
+
+        await client.delete(f'/users/{user_id}', headers=headers)
+
+    await sessionmanager.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark response rendering.')
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--concurrency', type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.requests, args.concurrency))
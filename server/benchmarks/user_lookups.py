@@ -0,0 +1,148 @@
+"""
+Compares latency and allocations of the user lookups, from row to DTO.
+
+The ORM paths rebuild `select(User).where(...)` on every call and validate the
+loaded instance into a DTO, as `UserService` did before. The projected paths
+execute the registered column statements of `src.user.queries` and map rows
+with `from_row`. Every lookup uses a fresh read-only session, like a request,
+and the user cache is bypassed so every lookup hits the database.
+
+Peak memory includes the read buffer asyncpg allocates for any statement,
+about 270 KiB, only differences between paths are meaningful.
+
+Usage (from `server/`, against the database configured in `.env`):
+    python -m benchmarks.user_lookups --iterations 2000
+"""
+
+import time
+import asyncio
+import argparse
+import statistics
+import tracemalloc
+from uuid import uuid4
+from typing import Any, Awaitable, Callable
+from sqlalchemy import delete, select
+
+from src.user.models import User
+from src.core.config import settings
+from src.core.queries import query_registry
+from src.core.database import sessionmanager
+from src.user.dtos import UserDto, UserInternalDto
+from src.user.queries import USER_BY_ID, USER_BY_USERNAME, USER_PROFILE_BY_ID
+
+PASSWORD_HASH = '$2b$12$' + 'x' * 53
+
+
+async def _peak_allocation(
+    lookup: Callable[[], Awaitable[Any]], iterations: int
+) -> float:
+    """Median of the memory peak reached during a lookup, in bytes."""
+    peaks = []
+    tracemalloc.start()
+    for _ in range(iterations):
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        await lookup()
+        peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    tracemalloc.stop()
+
+    return statistics.median(peaks)
+
+
+async def _measure(
+    label: str,
+    lookup: Callable[[], Awaitable[Any]],
+    iterations: int,
+) -> None:
+    # Warms up the compiled and prepared statement caches.
+    await lookup()
+
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await lookup()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    # Traced separately, tracing slows down every allocation.
+    peak = await _peak_allocation(lookup, max(iterations // 10, 1))
+
+    print(
+        f'{label:<28} {statistics.mean(latencies):>10.3f} '
+        f'{statistics.median(latencies):>10.3f} '
+        f'{statistics.quantiles(latencies, n=100)[98]:>10.3f} '
+        f'{peak / 1024:>12.1f}'
+    )
+
+
+async def main(iterations: int) -> None:
+    sessionmanager.init(settings.DB_URL)
+
+    name = f'bench_{uuid4().hex[:12]}'
+    async with sessionmanager.session() as session:
+        user = User(
+            username=name,
+            email=f'{name}@example.com',
+            first_name='Bench',
+            password_hash=PASSWORD_HASH,
+        )
+        session.add(user)
+        await session.commit()
+        user_id = user.id
+
+    async def orm(query: Any, dto: type[UserDto] | type[UserInternalDto]) -> Any:
+        async with sessionmanager.session(read_only=True) as session:
+            return dto.model_validate(await session.scalar(query))
+
+    async def projected(
+        query: Any,
+        params: dict[str, Any],
+        dto: type[UserDto] | type[UserInternalDto],
+    ) -> Any:
+        async with sessionmanager.session(read_only=True) as session:
+            return dto.from_row((await session.execute(query, params)).one())
+
+    lookups = {
+        'orm by id': lambda: orm(
+            select(User).where(User.id == user_id), UserInternalDto
+        ),
+        'projected by id': lambda: projected(
+            USER_BY_ID, {'id': user_id}, UserInternalDto
+        ),
+        'orm by username': lambda: orm(
+            select(User).where(User.username == name), UserInternalDto
+        ),
+        'projected by username': lambda: projected(
+            USER_BY_USERNAME, {'username': name}, UserInternalDto
+        ),
+        'orm profile': lambda: orm(select(User).where(User.id == user_id), UserDto),
+        'projected profile': lambda: projected(
+            USER_PROFILE_BY_ID, {'id': user_id}, UserDto
+        ),
+    }
+
+    print(
+        f'{"lookup":<28} {"mean ms":>10} {"p50 ms":>10} {"p99 ms":>10} {"peak KiB":>12}'
+    )
+    for label, lookup in lookups.items():
+        await _measure(label, lookup, iterations)
+
+    print()
+    for stats in query_registry.stats_list():
+        print(
+            f'{stats["name"]:<28} executions={stats["executions"]} '
+            f'cache_hits={stats["cache_hits"]} cache_misses={stats["cache_misses"]}'
+        )
+
+    async with sessionmanager.session() as session:
+        await session.execute(delete(User).where(User.id == user_id))
+        await session.commit()
+
+    await sessionmanager.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark user lookups.')
+    parser.add_argument('--iterations', type=int, default=1000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.iterations))
@@ -0,0 +1,160 @@
+"""
+Compares round trips and latency of the user write paths.
+
+The legacy paths reproduce the previous SELECT + flush + refresh flow, the
+current paths are the single statement `UserService` methods. Password hashing
+is replaced with a constant so only database work is measured.
+
+Usage (from `server/`, against the database configured in `.env`):
+    python -m benchmarks.user_writes --iterations 500
+"""
+
+import time
+import asyncio
+import argparse
+import statistics
+from uuid import UUID, uuid4
+from typing import Awaitable, Callable
+from sqlalchemy import event, select, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import src.user.services as user_services
+from src.user.models import User
+from src.core.config import settings
+from src.user.services import UserService
+from src.core.database import sessionmanager
+from src.user.dtos import UserCreateDto, UserUpdateDto
+
+PASSWORD_HASH = '$2b$12$' + 'x' * 53
+
+
+async def _constant_hash(password: str) -> str:
+    return PASSWORD_HASH
+
+
+class LegacyWrites:
+    """Write paths as implemented before RETURNING was used."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def create_user(self, create_dto: UserCreateDto) -> User:
+        query = select(User).where(
+            or_(User.username == create_dto.username, User.email == create_dto.email)
+        )
+        await self.db.scalar(query)
+
+        user = User(
+            username=create_dto.username,
+            email=create_dto.email,
+            first_name=create_dto.first_name,
+            last_name=create_dto.last_name,
+            password_hash=PASSWORD_HASH,
+        )
+        self.db.add(user)
+        await self.db.flush()
+        await self.db.refresh(user)
+        return user
+
+    async def update_user(self, id: UUID, update_dto: UserUpdateDto) -> User:
+        user = await self.db.scalar(select(User).where(User.id == id))
+        for key, value in update_dto.model_dump(exclude_unset=True).items():
+            setattr(user, key, value)
+
+        await self.db.flush()
+        await self.db.refresh(user)
+        return user
+
+    async def delete_user(self, id: UUID) -> None:
+        user = await self.db.scalar(select(User).where(User.id == id))
+        await self.db.delete(user)
+        await self.db.flush()
+
+
+def _create_dto() -> UserCreateDto:
+    name = f'bench_{uuid4().hex[:12]}'
+    return UserCreateDto(
+        username=name,
+        email=f'{name}@example.com',
+        first_name='Bench',
+        last_name='User',
+        password='bench1',
+    )
+
+
+async def _measure(
+    label: str,
+    operation: Callable[[AsyncSession], Awaitable[None]],
+    iterations: int,
+    counter: list[int],
+) -> None:
+    latencies = []
+    statements = 0
+
+    for _ in range(iterations):
+        async with sessionmanager.session() as session:
+            counter[0] = 0
+            start = time.perf_counter()
+            await operation(session)
+            await session.commit()
+            latencies.append((time.perf_counter() - start) * 1000)
+            statements += counter[0]
+
+    print(
+        f'{label:<24} {statements / iterations:>10.1f} '
+        f'{statistics.mean(latencies):>10.2f} {statistics.median(latencies):>10.2f}'
+    )
+
+
+async def _run_suite(
+    label: str, service_cls: type, iterations: int, counter: list[int]
+) -> None:
+    ids: list[UUID] = []
+    updates = 0
+
+    async def create(session: AsyncSession) -> None:
+        user = await service_cls(session).create_user(_create_dto())
+        ids.append(user.id)
+
+    async def update(session: AsyncSession) -> None:
+        nonlocal updates
+        user_id = ids[updates % len(ids)]
+        await service_cls(session).update_user(
+            user_id, UserUpdateDto(first_name='Updated')
+        )
+        updates += 1
+
+    async def remove(session: AsyncSession) -> None:
+        await service_cls(session).delete_user(ids.pop())
+
+    await _measure(f'{label} create', create, iterations, counter)
+    await _measure(f'{label} update', update, iterations, counter)
+    await _measure(f'{label} delete', remove, iterations, counter)
+
+
+async def main(iterations: int) -> None:
+    user_services.hash_password = _constant_hash
+    sessionmanager.init(settings.DB_URL)
+
+    # Statements sent by the driver, transaction control excluded.
+    counter = [0]
+
+    def count_statement(*args) -> None:
+        counter[0] += 1
+
+    engine = sessionmanager._engine.sync_engine  # type: ignore[union-attr]
+    event.listen(engine, 'before_cursor_execute', count_statement)
+
+    print(f'{"operation":<24} {"stmts/op":>10} {"mean ms":>10} {"p50 ms":>10}')
+    await _run_suite('legacy', LegacyWrites, iterations, counter)
+    await _run_suite('returning', UserService, iterations, counter)
+
+    await sessionmanager.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark user write paths.')
+    parser.add_argument('--iterations', type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.iterations))
@@ -0,0 +1,90 @@
+"""
+Measures how long a worker takes to boot, from process start to ready.
+
+Each run starts a fresh interpreter, like uvicorn does for every worker, and
+reports the time spent starting the interpreter, importing `src.server`,
+building the app and running the lifespan startup, warm-up included.
+
+Usage (from `server/`, against the database configured in `.env`):
+    python -m benchmarks.worker_boot --runs 10
+    python -m benchmarks.worker_boot --runs 10 --no-lifespan
+"""
+
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+BOOT = """
+import time
+start = time.perf_counter()
+
+import json
+import asyncio
+
+import src.server
+imported = time.perf_counter()
+
+app = src.server.api
+created = time.perf_counter()
+
+started = created
+if {lifespan}:
+    async def startup():
+        async with app.router.lifespan_context(app):
+            return time.perf_counter()
+
+    started = asyncio.run(startup())
+
+print(json.dumps({{
+    'import': imported - start,
+    'create_app': created - imported,
+    'lifespan': started - created,
+    'total': started - start,
+}}))
+"""
+
+
+def _boot(lifespan: bool) -> dict[str, float]:
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-c', BOOT.format(lifespan=lifespan)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall = time.perf_counter() - start
+
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    # Interpreter startup, plus the shutdown after the lifespan.
+    timings['interpreter'] = wall - timings['total']
+    timings['wall'] = wall
+    return timings
+
+
+def main(runs: int, lifespan: bool) -> None:
+    samples = [_boot(lifespan) for _ in range(runs)]
+
+    print(f'{"phase":<14} {"p50 ms":>10} {"min ms":>10} {"max ms":>10}')
+    for phase in ('interpreter', 'import', 'create_app', 'lifespan', 'wall'):
+        values = [sample[phase] * 1000 for sample in samples]
+        print(
+            f'{phase:<14} {statistics.median(values):>10.1f} '
+            f'{min(values):>10.1f} {max(values):>10.1f}'
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark worker boot time.')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument(
+        '--no-lifespan',
+        dest='lifespan',
+        action='store_false',
+        help='Skips the lifespan startup, which needs the database.',
+    )
+    args = parser.parse_args()
+
+    main(args.runs, args.lifespan)
@@ -1,12 +1,15 @@
+import hashlib
 from uuid import UUID
 from fastapi import Depends
 from fastapi.security.oauth2 import OAuth2PasswordBearer
 
-from src.auth.dtos import TokenDto
 from src.core.config import settings
+from src.core.context import get_request_context
+from src.auth.dtos import TokenDto, TokenTypeEnum, PrincipalDto
+from src.core.cache import token_cache, token_versions
 from src.auth.utils import decode_jwt
 from src.auth.services import AuthService
-from src.auth.interfaces import UserProvider, LoginUser
+from src.auth.interfaces import UserProvider, Principal
 from src.core.exceptions.exceptions import Unauthorized
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl='/auth/login')
@@ -32,35 +35,121 @@ def get_auth_service(
     return AuthService(user_provider=user_provider)
 
 
+def _check_version(min_version: int | None, version: int | None) -> None:
+    """
+    Rejects a token older than the minimum version of its user.
+
+    Args:
+        min_version: Minimum version still accepted, None when never bumped.
+        version: Token version of the token, None when it carries none.
+
+    Returns:
+        None
+
+    Raises:
+        Unauthorized: When the token was revoked.
+    """
+    if version is not None and min_version is not None and version < min_version:
+        raise Unauthorized('Token revoked.')
+
+
+def _track_user(user: Principal) -> None:
+    # Reported by the access log of the request.
+    context = get_request_context()
+    if context is not None:
+        context.user_id = user.id
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     user_provider: UserProvider = Depends(get_user_provider),
-) -> LoginUser:
+) -> Principal:
     """
     Dependency Injector for current user.
 
+    In claims mode the user is built from the access token claims, otherwise
+    it is fetched through the user provider.
+
     Args:
         token: Bearer token from Authorization header.
         user_provider: Injected user provider.
 
     Returns:
-        LoginUser: Current user.
+        Principal: Current user.
+
+    Raises:
+        Unauthorized: When the token is invalid or revoked.
     """
+    token_digest = hashlib.sha256(token.encode()).hexdigest()
+
+    if settings.TOKEN_CACHE_ENABLED:
+        cached = token_cache.get(token_digest)
+        if cached is not None:
+            cached_payload, cached_user = cached
+            # Versions may have been bumped since the token was cached.
+            min_version = await token_versions.get(str(cached_user.id))
+            _check_version(min_version, cached_payload.get('ver'))
+
+            cached_version = getattr(cached_user, 'token_version', None)
+            if (
+                min_version is None
+                or cached_version is None
+                or cached_version >= min_version
+            ):
+                _track_user(cached_user)
+                return cached_user
+
+            # The cached user predates the bump, resolve it again.
+            token_cache.delete(token_digest)
+
     payload = decode_jwt(
         token, settings.SECRET_KEY.get_secret_value(), settings.ALGORITHM
     )
     token_data = TokenDto(**payload)
 
+    # Refresh tokens carry the same claims, they must not be used as bearer.
+    if payload.get('type') != TokenTypeEnum.ACCESS.value:
+        raise Unauthorized('Token type mismatch.')
+
     if not token_data.sub:
         raise Unauthorized('Invalid credentials.')
 
+    # Bumped versions reject stale tokens without a lookup.
+    _check_version(await token_versions.get(token_data.sub), token_data.ver)
+
+    user: Principal | None
     try:
         user_uuid = UUID(token_data.sub)
-        user = await user_provider.get_user(user_uuid)
+
+        if settings.AUTH_CLAIMS_MODE:
+            if token_data.usr is None or token_data.ver is None:
+                raise Unauthorized('Invalid credentials.')
+
+            user = PrincipalDto(
+                id=user_uuid, username=token_data.usr, token_version=token_data.ver
+            )
+        else:
+            login_user = await user_provider.get_user(user_uuid)
+
+            if login_user is not None and token_data.ver is not None:
+                if token_data.ver < login_user.token_version:
+                    raise Unauthorized('Token revoked.')
+
+            user = login_user
     except ValueError:
         raise Unauthorized('Invalid user ID format')
 
     if user is None:
         raise Unauthorized('User not found')
 
+    if settings.TOKEN_CACHE_ENABLED:
+        # Entry never outlives the token and is dropped when the user changes.
+        token_cache.set(
+            token_digest,
+            (payload, user),
+            expires_at=payload.get('exp'),
+            tags=(str(user.id),),
+        )
+
+    _track_user(user)
     return user
@@ -1,4 +1,5 @@
 from enum import Enum
+from uuid import UUID
 
 from src.core.dtos import ResponseDto
 
@@ -12,6 +13,16 @@ class TokenTypeEnum(str, Enum):
 
 class TokenDto(ResponseDto):
     sub: str
+    usr: str | None = None
+    ver: int | None = None
+
+
+class PrincipalDto(ResponseDto):
+    """Authenticated user built from access token claims."""
+
+    id: UUID
+    username: str
+    token_version: int
 
 
 class AuthDto(ResponseDto):
@@ -5,14 +5,18 @@ from typing import Any, Protocol
 # Ensuring that if the `user` module is changed, it doesn't affects `auth` module.
 
 
-class LoginUser(Protocol):
+class Principal(Protocol):
     id: UUID
     username: str
-    password_hash: str
 
     def model_dump(self) -> dict[str, Any]: ...
 
 
+class LoginUser(Principal, Protocol):
+    password_hash: str
+    token_version: int
+
+
 class UserProvider(Protocol):
     async def get_user(self, id: UUID) -> LoginUser: ...
 
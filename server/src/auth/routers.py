@@ -1,14 +1,15 @@
 from typing import Annotated
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 from fastapi.security.oauth2 import OAuth2PasswordRequestForm
 
 from src.core.metadata import ApiTags
+from src.core.routing import UnitOfWorkRoute
 from src.auth.services import AuthService
 from src.auth.dtos import AuthDto, RefreshDto
 from src.auth.dependencies import get_auth_service
 
 
-router = APIRouter(prefix='/auth', tags=[ApiTags.auth])
+router = APIRouter(prefix='/auth', tags=[ApiTags.auth], route_class=UnitOfWorkRoute)
 
 
 @router.post(
@@ -18,6 +19,7 @@ router = APIRouter(prefix='/auth', tags=[ApiTags.auth])
     response_model_by_alias=True,
 )
 async def login_user_controller(
+    request: Request,
     login_data: Annotated[
         OAuth2PasswordRequestForm, Depends()
     ],  # Must be sent through form data by client
@@ -27,6 +29,7 @@ async def login_user_controller(
     Controller to login user.
 
     Args:
+        request: Incoming request, its client address is throttled.
         login_data: Username and password.
         auth_service: Injected auth service.
 
@@ -36,6 +39,7 @@ async def login_user_controller(
     return await auth_service.authenticate_user(
         login_data.username,
         login_data.password,
+        client_ip=request.client.host if request.client else None,
     )
 
 
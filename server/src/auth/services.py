@@ -1,12 +1,14 @@
+from uuid import UUID
 from typing import Any
 from jwt import PyJWTError
 from datetime import timedelta
 
 from src.core.config import settings
-from src.auth.interfaces import UserProvider
+from src.auth.interfaces import UserProvider, LoginUser
 from src.core.security import verify_password
+from src.auth.throttle import login_throttle
 from src.auth.utils import encode_jwt, decode_jwt
-from src.core.exceptions.exceptions import Unauthorized
+from src.core.exceptions.exceptions import NotFound, Unauthorized
 from src.auth.dtos import AuthDto, TokenTypeEnum, TokenDto
 
 
@@ -34,6 +36,23 @@ class AuthService:
             token_type=TokenTypeEnum.ACCESS,
         )
 
+    def _user_claims(self, user: LoginUser) -> dict[str, Any]:
+        """
+        Builds the claims identifying an user in its tokens.
+
+        Args:
+            user: User the tokens are issued for.
+
+        Returns:
+            dict[str, Any]: Subject, plus username and token version in claims mode.
+        """
+        claims: dict[str, Any] = {'sub': str(user.id)}
+
+        if settings.AUTH_CLAIMS_MODE:
+            claims.update({'usr': user.username, 'ver': user.token_version})
+
+        return claims
+
     def _create_refresh_token(self, data: dict[str, Any]) -> str:
         """
         Creates a refresh token.
@@ -52,34 +71,43 @@ class AuthService:
             token_type=TokenTypeEnum.REFRESH,
         )
 
-    async def authenticate_user(self, username: str, password: str) -> AuthDto:
+    async def authenticate_user(
+        self, username: str, password: str, client_ip: str | None = None
+    ) -> AuthDto:
         """
         Authenticates user using credentials.
 
         Args:
             username: Identifier used for authentication.
             password: Password to be validated.
+            client_ip: Address of the client, throttled along with the username.
 
         Returns:
             AuthDto: Created access and refresh tokens.
 
         Raises:
             Unauthorized: When credentials are invalid.
+            TooManyRequests: When the client IP or the username made too many attempts.
         """
+        if settings.LOGIN_THROTTLE_ENABLED:
+            await login_throttle.check(username, client_ip)
+
         user = await self.user_provider.get_user_by_username(username)
 
         if not user:
             raise Unauthorized('Invalid credentials')
 
-        if not verify_password(password, user.password_hash):
+        if not await verify_password(password, user.password_hash):
             raise Unauthorized('Invalid credentials.')
 
+        claims = self._user_claims(user)
+
         return AuthDto(
             access_token=self._create_access_token(
-                {'sub': str(user.id), 'type': TokenTypeEnum.ACCESS}
+                {**claims, 'type': TokenTypeEnum.ACCESS}
             ),
             refresh_token=self._create_refresh_token(
-                {'sub': str(user.id), 'type': TokenTypeEnum.REFRESH}
+                {**claims, 'type': TokenTypeEnum.REFRESH}
             ),
         )
 
@@ -92,16 +120,34 @@ class AuthService:
 
         Returns:
             AuthDto: Refreshed auth tokens.
+
+        Raises:
+            Unauthorized: When the token was revoked.
         """
         token_payload = await self.verify_token(refresh_token, TokenTypeEnum.REFRESH)
-        user_id = token_payload.sub
+        claims: dict[str, Any] = {'sub': token_payload.sub}
+
+        if settings.AUTH_CLAIMS_MODE:
+            # Claims must reflect the current user, so look it up once per refresh.
+            try:
+                user = await self.user_provider.get_user(UUID(token_payload.sub))
+            except ValueError:
+                raise Unauthorized('Invalid user ID format')
+            except NotFound:
+                # The user was deleted since the token was issued.
+                raise Unauthorized('Invalid credentials.')
+
+            if token_payload.ver is not None and token_payload.ver < user.token_version:
+                raise Unauthorized('Token revoked.')
+
+            claims = self._user_claims(user)
 
         return AuthDto(
             access_token=self._create_access_token(
-                {'sub': user_id, 'type': TokenTypeEnum.ACCESS}
+                {**claims, 'type': TokenTypeEnum.ACCESS}
             ),
             refresh_token=self._create_refresh_token(
-                {'sub': user_id, 'type': TokenTypeEnum.REFRESH}
+                {**claims, 'type': TokenTypeEnum.REFRESH}
             ),
         )
 
@@ -134,7 +180,7 @@ class AuthService:
             if not user_id:
                 raise Unauthorized('Token payload missing required data.')
 
-            return TokenDto(sub=user_id)
+            return TokenDto(sub=user_id, usr=payload.get('usr'), ver=payload.get('ver'))
 
         except (PyJWTError, KeyError):
             raise Unauthorized('Invalid or expired token.')
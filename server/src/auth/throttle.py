@@ -0,0 +1,272 @@
+import math
+import time
+import hashlib
+import secrets
+from array import array
+from typing import Protocol
+
+from src.core.logging import logger
+from src.core.config import settings
+from src.core.cache import get_redis
+from src.core.metrics import LOGIN_THROTTLED, labels
+from src.core.exceptions.exceptions import TooManyRequests
+
+
+def _retry_after(
+    current: float, previous: float, elapsed: float, window: int, limit: int
+) -> int:
+    """
+    Computes the seconds until an attempt fits in the sliding window again.
+
+    Args:
+        current: Attempts counted in the current fixed window.
+        previous: Attempts counted in the previous fixed window.
+        elapsed: Share of the current fixed window already elapsed.
+        window: Length of a window, in seconds.
+        limit: Attempts allowed in a window.
+
+    Returns:
+        int: Seconds to wait, at least 1.
+    """
+    if current < limit:
+        # Enough of the previous window has to slide out.
+        wait = 1 - (limit - current) / previous - elapsed
+    else:
+        # The current window has to end, then slide out in turn.
+        wait = 2 - elapsed - limit / current
+
+    return max(1, math.ceil(wait * window))
+
+
+class ThrottleBackend(Protocol):
+    """Counts attempts per key over a sliding window."""
+
+    async def hit(self, key: str, limit: int) -> int: ...
+
+
+class SlidingWindowSketch:
+    """
+    Approximate attempt counts per key over a sliding window, in fixed memory.
+
+    Counts of the current and previous fixed windows are kept in two
+    count-min sketches, the previous one weighted by the share of it still in
+    the sliding window. Collisions can only overestimate a count, conservative
+    updates keep that error low. Hashes are keyed per process so colliding
+    keys cannot be picked by a client.
+    """
+
+    def __init__(self, window: int, width: int, depth: int) -> None:
+        """
+        Constructor for sliding window sketch.
+
+        Args:
+            window: Length of the window, in seconds.
+            width: Counters per row, more counters mean fewer collisions.
+            depth: Rows, each hashing keys independently, at most 16.
+
+        Returns:
+            None
+        """
+        self.window = window
+        self.width = width
+        self.depth = depth
+
+        self._hash_key = secrets.token_bytes(16)
+        self._current = self._counters()
+        self._previous = self._counters()
+        self._window_index = 0
+
+    def _counters(self) -> array:
+        return array('I', bytes(4 * self.width * self.depth))
+
+    def _rotate(self, now: float) -> float:
+        index = int(now // self.window)
+        if index != self._window_index:
+            if index == self._window_index + 1:
+                self._previous = self._current
+            else:
+                self._previous = self._counters()
+
+            self._current = self._counters()
+            self._window_index = index
+
+        return (now % self.window) / self.window
+
+    def _slots(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(
+            key.encode(), digest_size=4 * self.depth, key=self._hash_key
+        ).digest()
+        return [
+            row * self.width
+            + int.from_bytes(digest[4 * row : 4 * row + 4], 'little') % self.width
+            for row in range(self.depth)
+        ]
+
+    async def hit(self, key: str, limit: int) -> int:
+        """
+        Counts an attempt of a key unless it is over the limit.
+
+        Args:
+            key: Key of the attempt.
+            limit: Attempts allowed in the window.
+
+        Returns:
+            int: 0 when the attempt is allowed, seconds to wait otherwise.
+        """
+        elapsed = self._rotate(time.monotonic())
+        slots = self._slots(key)
+
+        current = min(self._current[slot] for slot in slots)
+        previous = min(self._previous[slot] for slot in slots)
+
+        if current + previous * (1 - elapsed) >= limit:
+            # Rejected attempts are not counted, clients get through again
+            # once their attempts slide out, however often they retry.
+            return _retry_after(current, previous, elapsed, self.window, limit)
+
+        for slot in slots:
+            if self._current[slot] <= current:
+                self._current[slot] = current + 1
+
+        return 0
+
+
+class RedisThrottleBackend:
+    """
+    Exact attempt counts shared by every worker through a redis compatible server.
+
+    Each key has a counter per fixed window, expiring once it left the
+    sliding window. Keys are hashed so usernames are not stored. Errors are
+    logged and let the attempt through, the login still verifies credentials.
+    """
+
+    def __init__(self, namespace: str, window: int) -> None:
+        self.namespace = namespace
+        self.window = window
+
+    def _key(self, key: str, index: int) -> str:
+        digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+        return f'{self.namespace}:{digest}:{index}'
+
+    async def hit(self, key: str, limit: int) -> int:
+        """
+        Counts an attempt of a key unless it is over the limit.
+
+        Args:
+            key: Key of the attempt.
+            limit: Attempts allowed in the window.
+
+        Returns:
+            int: 0 when the attempt is allowed, seconds to wait otherwise.
+        """
+        from redis.exceptions import RedisError
+
+        now = time.time()
+        index = int(now // self.window)
+        elapsed = (now % self.window) / self.window
+        current_key = self._key(key, index)
+
+        redis = get_redis()
+        try:
+            # Counted first so the common case takes a single round trip.
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.incr(current_key)
+                pipe.pexpire(current_key, self.window * 2000)
+                pipe.get(self._key(key, index - 1))
+                current, _, previous = await pipe.execute()
+
+            current -= 1
+            previous = int(previous or 0)
+
+            if current + previous * (1 - elapsed) >= limit:
+                await redis.decr(current_key)
+                return _retry_after(current, previous, elapsed, self.window, limit)
+        except RedisError as exc:
+            logger.warning('Login throttle hit failed: {}', exc)
+
+        return 0
+
+
+class LoginThrottle:
+    """
+    Limits login attempts per client IP and per username.
+
+    Checked before the user lookup and the password verification, so
+    credential stuffing and password guessing are rejected for the cost of a
+    counter update instead of a query and a bcrypt hash.
+    """
+
+    def __init__(
+        self, backend: ThrottleBackend, username_limit: int, ip_limit: int
+    ) -> None:
+        """
+        Constructor for login throttle.
+
+        Args:
+            backend: Attempt counts.
+            username_limit: Attempts allowed per username in a window.
+            ip_limit: Attempts allowed per client IP in a window.
+
+        Returns:
+            None
+        """
+        self.backend = backend
+        self.username_limit = username_limit
+        self.ip_limit = ip_limit
+
+    async def check(self, username: str, client_ip: str | None) -> None:
+        """
+        Counts a login attempt, rejecting it when over a limit.
+
+        Args:
+            username: Username the attempt is for.
+            client_ip: Address of the client, when known.
+
+        Returns:
+            None
+
+        Raises:
+            TooManyRequests: When the client IP or the username made too many attempts.
+        """
+        keys = [('username', f'user:{username.casefold()}', self.username_limit)]
+        if client_ip is not None:
+            # Checked first so a throttled client does not count against the username.
+            keys.insert(0, ('ip', f'ip:{client_ip}', self.ip_limit))
+
+        for name, key, limit in keys:
+            retry_after = await self.backend.hit(key, limit)
+            if retry_after:
+                labels(LOGIN_THROTTLED, name).inc()
+                raise TooManyRequests(
+                    'Too many login attempts, please try again later.',
+                    retry_after=retry_after,
+                )
+
+
+def create_login_throttle() -> LoginThrottle:
+    """
+    Creates the login throttle with the backend selected by `LOGIN_THROTTLE_BACKEND`.
+
+    Returns:
+        LoginThrottle: Created throttle.
+    """
+    window = settings.LOGIN_THROTTLE_WINDOW_SECONDS
+
+    backend: ThrottleBackend
+    if settings.LOGIN_THROTTLE_BACKEND == 'redis':
+        backend = RedisThrottleBackend('login-throttle', window)
+    else:
+        backend = SlidingWindowSketch(
+            window,
+            width=settings.LOGIN_THROTTLE_SKETCH_WIDTH,
+            depth=settings.LOGIN_THROTTLE_SKETCH_DEPTH,
+        )
+
+    return LoginThrottle(
+        backend,
+        username_limit=settings.LOGIN_THROTTLE_USERNAME_LIMIT,
+        ip_limit=settings.LOGIN_THROTTLE_IP_LIMIT,
+    )
+
+
+login_throttle = create_login_throttle()
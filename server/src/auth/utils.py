@@ -1,9 +1,15 @@
 import jwt
 from typing import Any
 from datetime import datetime, timedelta, UTC
-from jwt import ExpiredSignatureError, InvalidTokenError
+from jwt import (
+    DecodeError,
+    InvalidTokenError,
+    ExpiredSignatureError,
+    InvalidSignatureError,
+)
 
 from src.auth.dtos import TokenTypeEnum
+from src.core.metrics import JWT_DECODE_FAILURES
 from src.core.exceptions.exceptions import Unauthorized
 
 
@@ -30,7 +36,7 @@ def encode_jwt(
     to_encode = payload.copy()
     to_encode.update({'exp': datetime.now(UTC) + expires_delta, 'type': token_type})
 
-    encoded_token = jwt.encode(payload, secret_key, algorithm)
+    encoded_token = jwt.encode(to_encode, secret_key, algorithm)
     return encoded_token
 
 
@@ -54,7 +60,20 @@ def decode_jwt(token: str, secret_key: str, algorithm: str) -> dict[str, Any]:
         return jwt.decode(token, key=secret_key, algorithms=[algorithm])
 
     except ExpiredSignatureError:
+        JWT_DECODE_FAILURES.labels('expired').inc()
         raise Unauthorized('Token expired.')
 
-    except InvalidTokenError:
+    except InvalidTokenError as exc:
+        JWT_DECODE_FAILURES.labels(_failure_reason(exc)).inc()
         raise Unauthorized('Invalid token.')
+
+
+def _failure_reason(exc: InvalidTokenError) -> str:
+    # Signature errors are decode errors too, so they are checked first.
+    if isinstance(exc, InvalidSignatureError):
+        return 'invalid_signature'
+
+    if isinstance(exc, DecodeError):
+        return 'malformed'
+
+    return 'invalid_claims'
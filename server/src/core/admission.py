@@ -0,0 +1,155 @@
+import asyncio
+from typing import Any
+from prometheus_client import REGISTRY
+
+from src.core.config import AdmissionLimit
+from src.core.metrics import ADMISSION_SHED, AdmissionCollector, labels
+from src.core.exceptions.exceptions import TooManyRequests, ServiceUnavailable
+
+
+class AdmissionLimiter:
+    """
+    Bounds the requests served at once, queueing a bounded number of others.
+
+    Requests beyond the queue are shed right away, queued requests are shed
+    when they wait longer than the timeout. Shedding early keeps saturated
+    routes from slowing down the rest of the app.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        concurrency: int,
+        queue: int,
+        timeout: float,
+        retry_after: int,
+    ) -> None:
+        """
+        Constructor for admission limiter.
+
+        Args:
+            name: Route or tag limited, reported in the stats.
+            concurrency: Requests served at once.
+            queue: Requests waiting for a slot, beyond that they are shed.
+            timeout: Seconds a request may wait for a slot.
+            retry_after: Seconds sent in the `Retry-After` header of shed requests.
+
+        Returns:
+            None
+        """
+        self.name = name
+        self.concurrency = concurrency
+        self.max_queue = queue
+        self.timeout = timeout
+        self.retry_after = retry_after
+
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.active = 0
+        self.waiting = 0
+
+        self.admitted = 0
+        self.shed_queue_full = 0
+        self.shed_timeout = 0
+
+    async def acquire(self) -> None:
+        """
+        Takes a slot, waiting in the queue when none is free.
+
+        Returns:
+            None
+
+        Raises:
+            TooManyRequests: When the queue is full.
+            ServiceUnavailable: When no slot frees up before the timeout.
+        """
+        if self._semaphore.locked():
+            if self.waiting >= self.max_queue:
+                self.shed_queue_full += 1
+                labels(ADMISSION_SHED, self.name, 'queue_full').inc()
+                raise TooManyRequests(
+                    'Too many concurrent requests, please try again later.',
+                    retry_after=self.retry_after,
+                )
+
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.timeout)
+            except asyncio.TimeoutError:
+                self.shed_timeout += 1
+                labels(ADMISSION_SHED, self.name, 'timeout').inc()
+                raise ServiceUnavailable(
+                    'Server is busy, please try again later.',
+                    retry_after=self.retry_after,
+                )
+            finally:
+                self.waiting -= 1
+        else:
+            await self._semaphore.acquire()
+
+        self.active += 1
+        self.admitted += 1
+
+    def release(self) -> None:
+        """
+        Frees a slot taken by `acquire`.
+
+        Returns:
+            None
+        """
+        self.active -= 1
+        self._semaphore.release()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Returns admission counters.
+
+        Returns:
+            dict[str, Any]: Limits, requests served and queued, admitted and shed requests.
+        """
+        return {
+            'name': self.name,
+            'concurrency': self.concurrency,
+            'max_queue': self.max_queue,
+            'active': self.active,
+            'waiting': self.waiting,
+            'admitted': self.admitted,
+            'shed_queue_full': self.shed_queue_full,
+            'shed_timeout': self.shed_timeout,
+        }
+
+
+def get_admission_limiter(name: str, limit: AdmissionLimit) -> AdmissionLimiter:
+    """
+    Returns the limiter of a route or tag, created on first use.
+
+    Limiters are shared by every app of the process, so their counters and
+    slots are not duplicated when the app is built again.
+
+    Args:
+        name: Route (`METHOD /path`) or tag limited.
+        limit: Limits of the route or tag.
+
+    Returns:
+        AdmissionLimiter: Limiter of the name.
+    """
+    limiter = admission_limiters.get(name)
+    if limiter is None:
+        limiter = AdmissionLimiter(
+            name,
+            concurrency=limit.concurrency,
+            queue=limit.queue,
+            timeout=limit.timeout_seconds,
+            retry_after=limit.retry_after_seconds,
+        )
+        admission_limiters[name] = limiter
+
+    return limiter
+
+
+# Every admission limiter of the process, for telemetry.
+admission_limiters: dict[str, AdmissionLimiter] = {}
+REGISTRY.register(
+    AdmissionCollector(
+        lambda: [limiter.stats() for limiter in admission_limiters.values()]
+    )
+)
@@ -0,0 +1,344 @@
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Generic, Hashable, Iterable, Protocol, TypeVar
+
+from src.core.logging import logger
+from src.core.config import settings
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded in-process LRU cache whose entries expire individually."""
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        """
+        Constructor for TTL cache.
+
+        Args:
+            max_size: Maximum number of entries before the least recently used is evicted.
+            ttl: Default time to live of an entry, in seconds.
+
+        Returns:
+            None
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+
+        self._entries: OrderedDict[K, tuple[float, V, tuple[str, ...]]] = OrderedDict()
+        self._tags: dict[str, set[K]] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        """
+        Fetches an entry, dropping it if it has expired.
+
+        Args:
+            key: Key of the entry.
+
+        Returns:
+            V | None: Cached value, None on a miss.
+        """
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value, _ = entry
+        if expires_at <= time.monotonic():
+            self.delete(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(
+        self,
+        key: K,
+        value: V,
+        ttl: float | None = None,
+        expires_at: float | None = None,
+        tags: Iterable[str] = (),
+    ) -> None:
+        """
+        Stores an entry, evicting the least recently used one when full.
+
+        Args:
+            key: Key of the entry.
+            value: Value to cache.
+            ttl: Time to live in seconds, defaults to the cache TTL.
+            expires_at: Unix timestamp the entry must never outlive.
+            tags: Tags used to invalidate groups of entries.
+
+        Returns:
+            None
+        """
+        lifetime = self.ttl if ttl is None else ttl
+        if expires_at is not None:
+            lifetime = min(lifetime, expires_at - time.time())
+
+        if lifetime <= 0:
+            return
+
+        self.delete(key)
+
+        entry_tags = tuple(tags)
+        self._entries[key] = (time.monotonic() + lifetime, value, entry_tags)
+        for tag in entry_tags:
+            self._tags.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self.max_size:
+            oldest = next(iter(self._entries))
+            self.delete(oldest)
+            self.evictions += 1
+
+    def delete(self, key: K) -> None:
+        """
+        Removes an entry if present.
+
+        Args:
+            key: Key of the entry.
+
+        Returns:
+            None
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def invalidate_tag(self, tag: str) -> None:
+        """
+        Removes every entry stored with the given tag.
+
+        Args:
+            tag: Tag to invalidate.
+
+        Returns:
+            None
+        """
+        for key in list(self._tags.get(tag, ())):
+            self.delete(key)
+
+    def clear(self) -> None:
+        """
+        Removes every entry.
+
+        Returns:
+            None
+        """
+        self._entries.clear()
+        self._tags.clear()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns cache counters.
+
+        Returns:
+            dict[str, int]: Size, hits, misses and evictions.
+        """
+        return {
+            'size': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+class CacheBackend(Protocol):
+    """Byte oriented key value store shared by module level caches."""
+
+    async def get(self, key: str) -> bytes | None: ...
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    async def delete(self, *keys: str) -> None: ...
+
+
+class MemoryCacheBackend:
+    """Cache backend local to the current process."""
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self._cache: TTLCache[str, bytes] = TTLCache(max_size=max_size, ttl=ttl)
+
+    async def get(self, key: str) -> bytes | None:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._cache.set(key, value, ttl=ttl)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._cache.delete(key)
+
+    def stats(self) -> dict[str, int]:
+        return self._cache.stats()
+
+
+_redis: 'Redis | None' = None
+
+
+def get_redis() -> 'Redis':
+    """
+    Returns the process wide redis client, creating it on first use.
+
+    Returns:
+        Redis: Client connected to `CACHE_REDIS_URL`.
+    """
+    global _redis
+
+    if _redis is None:
+        # Imported lazily so the in-memory backend works without redis installed.
+        from redis.asyncio import Redis
+
+        _redis = Redis.from_url(settings.CACHE_REDIS_URL)
+
+    return _redis
+
+
+async def close_redis() -> None:
+    """
+    Closes the redis client if it was created.
+
+    Returns:
+        None
+    """
+    global _redis
+
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+
+class RedisCacheBackend:
+    """
+    Cache backend shared by every worker through a redis compatible server.
+
+    Size bound eviction is delegated to the server `maxmemory` policy.
+    Errors are logged and treated as misses so the cache never fails a request.
+    """
+
+    def __init__(self, namespace: str) -> None:
+        self.namespace = namespace
+
+    def _key(self, key: str) -> str:
+        return f'{self.namespace}:{key}'
+
+    async def get(self, key: str) -> bytes | None:
+        from redis.exceptions import RedisError
+
+        try:
+            return await get_redis().get(self._key(key))
+        except RedisError as exc:
+            logger.warning('Cache get failed: {}', exc)
+            return None
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        from redis.exceptions import RedisError
+
+        try:
+            await get_redis().set(self._key(key), value, px=int(ttl * 1000))
+        except RedisError as exc:
+            logger.warning('Cache set failed: {}', exc)
+
+    async def delete(self, *keys: str) -> None:
+        from redis.exceptions import RedisError
+
+        try:
+            await get_redis().delete(*(self._key(key) for key in keys))
+        except RedisError as exc:
+            logger.warning('Cache delete failed: {}', exc)
+
+
+def cache_ttl(ttl: float) -> float:
+    """
+    Caps the time to live of entries when invalidations stay in their worker.
+
+    Args:
+        ttl: Configured time to live, in seconds.
+
+    Returns:
+        float: Time to live to use, capped with the `memory` backend.
+    """
+    if settings.CACHE_BACKEND == 'memory':
+        return min(ttl, settings.CACHE_MEMORY_MAX_TTL_SECONDS)
+
+    return ttl
+
+
+def create_cache_backend(namespace: str, max_size: int, ttl: float) -> CacheBackend:
+    """
+    Creates the cache backend selected by `CACHE_BACKEND`.
+
+    Args:
+        namespace: Prefix isolating the keys of the caller.
+        max_size: Maximum number of entries of an in-memory backend.
+        ttl: Default time to live of an in-memory entry, in seconds.
+
+    Returns:
+        CacheBackend: Created backend.
+    """
+    if settings.CACHE_BACKEND == 'redis':
+        return RedisCacheBackend(namespace)
+
+    return MemoryCacheBackend(max_size=max_size, ttl=ttl)
+
+
+class TokenVersions:
+    """
+    Minimum token version still accepted per user ID, bumped on password
+    change and deletion.
+
+    Entries live as long as a refresh token, older tokens are rejected by
+    their expiry after that. The `redis` backend shares them between workers,
+    with the `memory` backend only the worker that handled the change knows
+    about it.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: float) -> None:
+        self.backend = backend
+        self.ttl = ttl
+
+    async def get(self, user_id: str) -> int | None:
+        value = await self.backend.get(user_id)
+        return int(value) if value is not None else None
+
+    async def set(self, user_id: str, version: int) -> None:
+        await self.backend.set(user_id, str(version).encode(), self.ttl)
+
+
+token_versions = TokenVersions(
+    backend=create_cache_backend(
+        'token-version',
+        max_size=settings.TOKEN_CACHE_MAX_SIZE,
+        ttl=settings.REFRESH_TOKEN_EXPIRES_DAYS * 24 * 60 * 60,
+    ),
+    ttl=settings.REFRESH_TOKEN_EXPIRES_DAYS * 24 * 60 * 60,
+)
+
+# NOTE: The token cache lives in `core` because the `auth` module fills it
+# while the `user` module has to invalidate it when a user changes.
+# Entries are tagged with the user ID.
+token_cache: TTLCache[str, tuple[dict[str, Any], Any]] = TTLCache(
+    max_size=settings.TOKEN_CACHE_MAX_SIZE,
+    ttl=cache_ttl(settings.TOKEN_CACHE_TTL_SECONDS),
+)
@@ -0,0 +1,111 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Self
+from fastapi import Request, Response, status
+
+
+def _opaque_tag(etag: str) -> str:
+    # Weak comparison, as required for If-None-Match.
+    etag = etag.strip()
+    return etag[2:] if etag.startswith('W/') else etag
+
+
+@dataclass(frozen=True)
+class Validators:
+    """
+    Validators of a representation, derived from the version of its resource.
+
+    A resource exposing a version stamp, like its `updated_at`, can answer a
+    conditional GET from the stamp alone, before loading and serializing the
+    resource. ETags are weak as the bytes sent may change with the encoding.
+    """
+
+    etag: str
+    last_modified: datetime
+
+    @classmethod
+    def from_version(cls, version: datetime, *parts: Any) -> Self:
+        """
+        Derives the validators of a representation.
+
+        Args:
+            version: Last modification time of the resource.
+            parts: Anything else the representation depends on, like the
+                fields of its response model, so changing them changes the ETag.
+
+        Returns:
+            Self: Validators of the representation.
+        """
+        digest = hashlib.blake2b(
+            repr((version.isoformat(), *parts)).encode(), digest_size=8
+        ).hexdigest()
+        return cls(etag=f'W/"{digest}"', last_modified=version)
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {
+            'ETag': self.etag,
+            'Last-Modified': format_datetime(
+                self.last_modified.astimezone(UTC), usegmt=True
+            ),
+            # Clients keep the representation but revalidate it on every use.
+            'Cache-Control': 'private, no-cache',
+        }
+
+    def is_fresh(self, request: Request) -> bool:
+        """
+        Tells whether the client already has this representation.
+
+        `If-None-Match` takes precedence over `If-Modified-Since`, which only
+        has a precision of one second. Only meant for GET and HEAD requests.
+
+        Args:
+            request: Conditional request.
+
+        Returns:
+            bool: True when the request can be answered by a 304.
+        """
+        if_none_match = request.headers.get('if-none-match')
+        if if_none_match is not None:
+            if if_none_match.strip() == '*':
+                return True
+
+            etag = _opaque_tag(self.etag)
+            return any(_opaque_tag(tag) == etag for tag in if_none_match.split(','))
+
+        if_modified_since = request.headers.get('if-modified-since')
+        if if_modified_since is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=UTC)
+
+            return self.last_modified.replace(microsecond=0) <= since
+
+        return False
+
+    def not_modified(self) -> Response:
+        """
+        Builds the 304 answering a fresh conditional request.
+
+        Returns:
+            Response: Empty response carrying the validators.
+        """
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=self.headers)
+
+    def apply(self, response: Response) -> None:
+        """
+        Sets the validators on the response of an endpoint.
+
+        Args:
+            response: Response injected in the endpoint.
+
+        Returns:
+            None
+        """
+        response.headers.update(self.headers)
@@ -1,7 +1,16 @@
 import urllib.parse
 from typing import Literal
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import field_validator, computed_field, SecretStr
+from pydantic import BaseModel, field_validator, computed_field, SecretStr
+
+
+class AdmissionLimit(BaseModel):
+    """Concurrency limit of a route or tag, see `ADMISSION_LIMITS`."""
+
+    concurrency: int
+    queue: int = 0
+    timeout_seconds: float = 1.0
+    retry_after_seconds: int = 1
 
 
 class Settings(BaseSettings):
@@ -13,6 +22,111 @@ class Settings(BaseSettings):
     REFRESH_TOKEN_EXPIRES_DAYS: int
     ACCESS_TOKEN_EXPIRES_MINUTES: int
 
+    # Builds the authenticated user from access token claims instead of the database.
+    AUTH_CLAIMS_MODE: bool = False
+
+    # Verified tokens and their users, kept per worker. A change to an user drops
+    # them in the worker that handled it, the others reject revoked tokens through
+    # the shared token versions with the `redis` backend, or once the entry
+    # expires with `memory`, see CACHE_MEMORY_MAX_TTL_SECONDS.
+    TOKEN_CACHE_ENABLED: bool = True
+    TOKEN_CACHE_MAX_SIZE: int = 10_000
+    TOKEN_CACHE_TTL_SECONDS: int = 60
+
+    # `redis` shares cached entries, and their invalidation, between workers through
+    # a redis compatible server. With `memory` a write only invalidates the worker
+    # that handled it, the others serve the old entry until it expires, so TTLs
+    # are capped to CACHE_MEMORY_MAX_TTL_SECONDS. Raise it with a single worker.
+    CACHE_BACKEND: Literal['memory', 'redis'] = 'memory'
+    CACHE_REDIS_URL: str = 'redis://localhost:6379/0'
+    CACHE_MEMORY_MAX_TTL_SECONDS: int = 10
+
+    USER_CACHE_ENABLED: bool = True
+    USER_CACHE_MAX_SIZE: int = 10_000
+    USER_CACHE_TTL_SECONDS: int = 300
+    USER_CACHE_NEGATIVE_TTL_SECONDS: int = 30
+    # Version stamps answering conditional profile requests. Read along with
+    # profiles, possibly from a replica, so a 304 may lag a change by the
+    # replica lag on top of this.
+    USER_VERSION_CACHE_TTL_SECONDS: int = 30
+
+    # Maximum number of IDs resolved by a single batch lookup.
+    USER_BATCH_MAX_SIZE: int = 100
+    USER_PAGE_MAX_SIZE: int = 100
+    # Rows fetched per round trip from the server-side cursor of an export.
+    USER_EXPORT_BATCH_SIZE: int = 1000
+    # Rows validated, hashed and copied together by a bulk import.
+    USER_IMPORT_BATCH_SIZE: int = 1000
+    # Longest line accepted by an import, a longer one fails the import
+    # with the batches before it already imported.
+    USER_IMPORT_MAX_LINE_BYTES: int = 64 * 1024
+    # Failed rows listed in the response of an import, the others are only counted.
+    USER_IMPORT_MAX_REPORTED_ERRORS: int = 1000
+
+    # Returns DTOs of the declared response model without FastAPI validating them again.
+    DTO_RESPONSES_ENABLED: bool = True
+
+    # Client errors logged per route and error in a window, later ones are sampled.
+    ERROR_LOG_BURST: int = 10
+    ERROR_LOG_WINDOW_SECONDS: float = 60
+    ERROR_LOG_SAMPLE_RATE: float = 0.01
+
+    # JSON log records waiting for the writer thread in production, dropped when full.
+    LOG_QUEUE_MAX_SIZE: int = 10_000
+    LOG_BATCH_SIZE: int = 200
+    LOG_FLUSH_INTERVAL_SECONDS: float = 0.5
+    ACCESS_LOG_ENABLED: bool = True
+
+    # Records request, database and authentication metrics served on `/metrics`.
+    METRICS_ENABLED: bool = True
+
+    # Profiles requests sending the internal token in `X-Profile-Token`, plus a
+    # sampled share of all requests. Requires the `profiling` extra.
+    PROFILING_ENABLED: bool = False
+    PROFILING_SAMPLE_RATE: float = 0.0
+    PROFILING_INTERVAL_SECONDS: float = 0.001
+    PROFILING_OUTPUT_DIR: str = 'profiles'
+
+    # Requests served at once per route (`METHOD /path`) or tag, the others
+    # wait in a bounded queue. A full queue answers 429, a wait past the
+    # timeout answers 503, both with `Retry-After`. Set as JSON, like
+    # `{"auth": {"concurrency": 16, "queue": 64, "timeout_seconds": 2}}`.
+    ADMISSION_CONTROL_ENABLED: bool = True
+    ADMISSION_LIMITS: dict[str, AdmissionLimit] = {
+        'auth': AdmissionLimit(concurrency=16, queue=64, timeout_seconds=2.0),
+        'POST /users/': AdmissionLimit(concurrency=8, queue=32, timeout_seconds=2.0),
+    }
+
+    # Login attempts allowed per client IP and per username in a sliding window,
+    # counted before the user lookup and password verification. `redis` shares
+    # exact counts between workers through `CACHE_REDIS_URL`, `memory` keeps
+    # approximate counts per worker in a fixed size sketch.
+    LOGIN_THROTTLE_ENABLED: bool = True
+    LOGIN_THROTTLE_BACKEND: Literal['memory', 'redis'] = 'memory'
+    LOGIN_THROTTLE_WINDOW_SECONDS: int = 60
+    LOGIN_THROTTLE_USERNAME_LIMIT: int = 10
+    LOGIN_THROTTLE_IP_LIMIT: int = 100
+    LOGIN_THROTTLE_SKETCH_WIDTH: int = 16_384
+    LOGIN_THROTTLE_SKETCH_DEPTH: int = 4
+
+    # Statements slower than the threshold are logged and reported on
+    # `/internal/db/slow-queries`. The first executions of each statement can be
+    # explained, with ANALYZE for SELECT statements, 0 disables EXPLAIN.
+    SLOW_QUERY_THRESHOLD_MS: float = 200
+    SLOW_QUERY_EXPLAIN_SAMPLES: int = 0
+    SLOW_QUERY_MAX_FINGERPRINTS: int = 200
+
+    PASSWORD_HASHER_EXECUTOR: Literal['process', 'thread'] = 'process'
+    PASSWORD_HASHER_WORKERS: int | None = None  # Defaults to the number of CPUs
+    PASSWORD_HASHER_MAX_PENDING: int = 64
+    # Bulk imports hash a few passwords per call, with a bounded number of calls
+    # in the pool, so logins queue behind at most one small chunk.
+    PASSWORD_HASHER_BULK_CHUNK_SIZE: int = 2
+    PASSWORD_HASHER_BULK_CONCURRENCY: int | None = None  # Defaults to half the workers
+
+    # Required by internal endpoints, which are open only in development when unset.
+    INTERNAL_API_TOKEN: SecretStr | None = None
+
     ALLOWED_ORIGINS: str | list[str]
 
     @field_validator('ALLOWED_ORIGINS', mode='before')
@@ -33,9 +147,36 @@ class Settings(BaseSettings):
     DB_HOST: str
     DB_PORT: str
 
-    @computed_field
-    @property
-    def DB_URL(self) -> str:
+    DB_POOL_SIZE: int = 10
+    DB_POOL_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_WARMUP_CONNECTIONS: int = 5
+    # Primes the hasher, JWT, OpenAPI schema and routes at startup, on top of the pool.
+    WARM_UP_ENABLED: bool = True
+    # Prepared statements cached per connection by the asyncpg dialect, 0 disables.
+    DB_STATEMENT_CACHE_SIZE: int = 100
+
+    # Read replicas as `host` or `host:port`, comma separated. They share
+    # credentials and database name with the primary.
+    DB_REPLICA_HOSTS: str | list[str] = []
+    DB_REPLICA_MAX_LAG_SECONDS: float = 5.0
+    DB_REPLICA_HEALTH_CHECK_SECONDS: float = 10.0
+
+    @field_validator('DB_REPLICA_HOSTS', mode='before')
+    @classmethod
+    def parse_replica_hosts(cls, v) -> list[str]:
+        if isinstance(v, list):
+            return v
+
+        elif isinstance(v, str):
+            return [host.strip() for host in v.split(',') if host.strip()]
+
+        else:
+            raise TypeError(f'Invalid type for DB_REPLICA_HOSTS: {type(v)}')
+
+    def _build_db_url(self, host: str, port: str) -> str:
         safe_password = urllib.parse.quote_plus(self.DB_PASSWORD.get_secret_value())
         safe_username = urllib.parse.quote_plus(self.DB_USERNAME)
 
@@ -45,9 +186,24 @@ class Settings(BaseSettings):
 
         return (
             f'postgresql+asyncpg://{safe_username}:{safe_password}'
-            f'@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}{ssl_param}'
+            f'@{host}:{port}/{self.DB_NAME}{ssl_param}'
         )
 
+    @computed_field
+    @property
+    def DB_URL(self) -> str:
+        return self._build_db_url(self.DB_HOST, self.DB_PORT)
+
+    @computed_field
+    @property
+    def DB_REPLICA_URLS(self) -> list[str]:
+        urls = []
+        for replica in self.DB_REPLICA_HOSTS:
+            host, _, port = replica.partition(':')
+            urls.append(self._build_db_url(host, port or self.DB_PORT))
+
+        return urls
+
     model_config = SettingsConfigDict(
         env_file=('.env', '.env.local', '.env.production')
     )
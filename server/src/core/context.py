@@ -0,0 +1,34 @@
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+if TYPE_CHECKING:
+    from src.core.database import UnitOfWork
+
+
+@dataclass
+class RequestContext:
+    """State collected while serving a single request."""
+
+    request_id: str | None = None
+    user_id: UUID | None = None
+    route: str | None = None
+    statements: int = 0
+    db_seconds: float = 0.0
+    units: list['UnitOfWork'] = field(default_factory=list)
+
+
+request_context: ContextVar[RequestContext | None] = ContextVar(
+    'request_context', default=None
+)
+
+
+def get_request_context() -> RequestContext | None:
+    """
+    Returns the context of the request being served.
+
+    Returns:
+        RequestContext | None: Current request context, None outside of a request.
+    """
+    return request_context.get()
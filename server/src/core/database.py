@@ -1,6 +1,15 @@
+import time
+import asyncio
+import itertools
 import contextlib
-from typing import TypeVar, AsyncIterator
-from sqlalchemy.orm import DeclarativeBase
+from dataclasses import dataclass
+from sqlalchemy import TextClause, event, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import DeclarativeBase, ORMExecuteState, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from typing import Any, Awaitable, Callable, TypeVar, AsyncIterator, Sequence
+from prometheus_client import REGISTRY
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -9,6 +18,12 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
+from src.core.logging import logger
+from src.core.metrics import DB_QUERY_DURATION, PoolCollector, labels
+from src.core.queries import query_registry
+from src.core.slow_queries import slow_query_log
+from src.core.context import get_request_context
+
 
 class Base(DeclarativeBase):
     pass
@@ -16,6 +31,223 @@ class Base(DeclarativeBase):
 
 ModelType = TypeVar('ModelType', bound=Base)  # type: ignore
 
+# Replication lag in seconds, zero when the replica has replayed everything it received.
+REPLICA_LAG_QUERY = text(
+    'SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 '
+    'ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) '
+    'END'
+)
+
+
+# Key of the callbacks waiting for the commit of a session, in `Session.info`.
+_AFTER_COMMIT = 'after_commit'
+
+
+class TrackedSession(Session):
+    """Session remembering whether it wrote anything since its last commit."""
+
+    has_writes = False
+
+
+@event.listens_for(TrackedSession, 'do_orm_execute')
+def _track_execute(orm_execute_state: ORMExecuteState) -> None:
+    # Only DML counts, textual SQL is not parsed so it counts whatever it does.
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+        or isinstance(orm_execute_state.statement, TextClause)
+    ):
+        orm_execute_state.session.has_writes = True  # type: ignore[attr-defined]
+
+
+@event.listens_for(TrackedSession, 'after_flush')
+def _track_flush(session: TrackedSession, flush_context: Any) -> None:
+    session.has_writes = True
+
+
+@event.listens_for(TrackedSession, 'after_commit')
+@event.listens_for(TrackedSession, 'after_rollback')
+def _reset_writes(session: TrackedSession) -> None:
+    session.has_writes = False
+
+
+@event.listens_for(TrackedSession, 'after_rollback')
+def _drop_after_commit(session: TrackedSession) -> None:
+    session.info.pop(_AFTER_COMMIT, None)
+
+
+def after_commit(
+    session: AsyncSession, callback: Callable[[], Awaitable[None]]
+) -> None:
+    """
+    Runs a callback once the writes of a request session are committed.
+
+    Caches must forget a row only once other requests can read its new
+    version, otherwise a concurrent lookup caches the old row again. Callbacks
+    are dropped when the transaction rolls back, and only run for sessions
+    completed by an `UnitOfWork`.
+
+    Args:
+        session: Session holding the writes.
+        callback: Coroutine function called without arguments.
+
+    Returns:
+        None
+    """
+    session.sync_session.info.setdefault(_AFTER_COMMIT, []).append(callback)
+
+
+def _start_statement_timer(conn, cursor, statement, parameters, context, executemany):
+    context._started_at = time.perf_counter()
+
+
+def _record_statement(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context._started_at
+
+    query_registry.record(context)
+    labels(
+        DB_QUERY_DURATION, context.execution_options.get('query_name', 'unregistered')
+    ).observe(elapsed)
+
+    request = get_request_context()
+    if request is not None:
+        request.statements += 1
+        request.db_seconds += elapsed
+
+    if elapsed >= slow_query_log.threshold:
+        slow_query_log.record(
+            conn, statement, parameters, context, executemany, elapsed
+        )
+
+
+def _create_engine(url: str, **engine_kwargs: Any) -> AsyncEngine:
+    """
+    Creates an engine that reports executed statements to the request context.
+
+    Args:
+        url: Connection string for database.
+        engine_kwargs: Options passed to the engine.
+
+    Returns:
+        AsyncEngine: Created engine.
+    """
+    engine = create_async_engine(url, **engine_kwargs)
+    sync_engine: Engine = engine.sync_engine
+
+    event.listen(sync_engine, 'before_cursor_execute', _start_statement_timer)
+    event.listen(sync_engine, 'after_cursor_execute', _record_statement)
+
+    return engine
+
+
+def _create_sessionmaker(engine: AsyncEngine, read_only: bool) -> async_sessionmaker:
+    """
+    Creates a sessionmaker for an engine.
+
+    Read-only sessions run in autocommit mode, so a lookup is a single round
+    trip without BEGIN and COMMIT.
+
+    Args:
+        engine: Engine the sessions are bound to.
+        read_only: Whether the sessions only read.
+
+    Returns:
+        async_sessionmaker: Created sessionmaker.
+    """
+    if read_only:
+        engine = engine.execution_options(isolation_level='AUTOCOMMIT')
+
+    return async_sessionmaker(
+        autocommit=False,
+        bind=engine,
+        expire_on_commit=False,
+        sync_session_class=TrackedSession,
+    )
+
+
+class UnitOfWork:
+    """Request scoped session that only commits when it wrote something."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self.completed = False
+
+    async def complete(self) -> None:
+        """
+        Commits pending writes, skipping COMMIT for read-only work, releases
+        the connection back to the pool, then runs the `after_commit` callbacks.
+        Calling it again is a no-op.
+
+        Returns:
+            None
+        """
+        if self.completed:
+            return
+
+        self.completed = True
+        callbacks = self.session.sync_session.info.pop(_AFTER_COMMIT, [])
+
+        if self.session.sync_session.has_writes:  # type: ignore[attr-defined]
+            await self.session.commit()
+
+        await self.session.close()
+
+        for callback in callbacks:
+            # The writes are committed whatever happens to the callbacks.
+            try:
+                await callback()
+            except Exception:
+                logger.exception('After commit callback failed.')
+
+
+class TimedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long checkouts wait for a connection."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def connect(self) -> Any:
+        start = time.perf_counter()
+
+        try:
+            return super().connect()
+        finally:
+            waited = time.perf_counter() - start
+            self.checkouts += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+    def status_dict(self) -> dict[str, Any]:
+        """
+        Returns occupancy and wait statistics of the pool.
+
+        Returns:
+            dict[str, Any]: Pool telemetry.
+        """
+        return {
+            'size': self.size(),
+            'checked_in': self.checkedin(),
+            'checked_out': self.checkedout(),
+            'overflow': max(self.overflow(), 0),
+            'checkouts': self.checkouts,
+            'wait_seconds_total': self.wait_seconds_total,
+            'wait_seconds_max': self.wait_seconds_max,
+        }
+
+
+@dataclass
+class Replica:
+    """Read replica engine along with its last known health."""
+
+    engine: AsyncEngine
+    sessionmaker: async_sessionmaker
+    healthy: bool = True
+    lag_seconds: float = 0.0
+
 
 class DatabaseSessionManager:
     def __init__(self) -> None:
@@ -27,21 +259,53 @@ class DatabaseSessionManager:
         """
         self._engine: AsyncEngine | None = None
         self._sessionmaker: async_sessionmaker | None = None
+        self._read_sessionmaker: async_sessionmaker | None = None
+
+        self._replicas: list[Replica] = []
+        self._replica_cycle: itertools.cycle | None = None
+        self._max_replica_lag = 0.0
+        self._health_check_interval = 0.0
+        self._health_check_task: asyncio.Task | None = None
 
-    def init(self, db_url: str) -> None:
+    def init(
+        self,
+        db_url: str,
+        replica_urls: Sequence[str] = (),
+        max_replica_lag: float = 5.0,
+        health_check_interval: float = 10.0,
+        **engine_kwargs: Any,
+    ) -> None:
         """
-        Initializes engine and sessionmaker for database.
+        Initializes engines and sessionmakers for database.
 
         Args:
-            db_url: Connection string for database.
+            db_url: Connection string for the primary database.
+            replica_urls: Connection strings for read replicas.
+            max_replica_lag: Lag in seconds after which a replica stops serving reads.
+            health_check_interval: Seconds between replica health checks.
+            engine_kwargs: Pool options passed to every engine.
 
         Returns:
             None
         """
-        self._engine = create_async_engine(db_url)
-        self._sessionmaker = async_sessionmaker(
-            autocommit=False, bind=self._engine, expire_on_commit=False
-        )
+        engine_kwargs.setdefault('poolclass', TimedAsyncQueuePool)
+
+        self._engine = _create_engine(db_url, **engine_kwargs)
+        self._sessionmaker = _create_sessionmaker(self._engine, read_only=False)
+        self._read_sessionmaker = _create_sessionmaker(self._engine, read_only=True)
+
+        for replica_url in replica_urls:
+            engine = _create_engine(replica_url, **engine_kwargs)
+            self._replicas.append(
+                Replica(
+                    engine=engine,
+                    sessionmaker=_create_sessionmaker(engine, read_only=True),
+                )
+            )
+
+        self._replica_cycle = itertools.cycle(self._replicas)
+        self._max_replica_lag = max_replica_lag
+        self._health_check_interval = health_check_interval
 
     async def close(self) -> None:
         """
@@ -53,9 +317,144 @@ class DatabaseSessionManager:
         if not self._engine:
             raise Exception('Database session manager not initialized.')
 
+        if self._health_check_task:
+            self._health_check_task.cancel()
+            self._health_check_task = None
+
+        for replica in self._replicas:
+            await replica.engine.dispose()
+
         await self._engine.dispose()
         self._engine = None
         self._sessionmaker = None
+        self._read_sessionmaker = None
+        self._replicas = []
+        self._replica_cycle = None
+
+    async def warm_up(self, connections: int) -> None:
+        """
+        Opens connections ahead of traffic so first requests skip connection setup.
+
+        Args:
+            connections: Connections to open per engine, capped by its pool size.
+
+        Returns:
+            None
+        """
+        if not self._engine:
+            raise Exception('Database session manager not initialized.')
+
+        await self.check_replicas()
+
+        engines = [self._engine]
+        engines.extend(replica.engine for replica in self._replicas if replica.healthy)
+
+        for engine in engines:
+            pool = engine.sync_engine.pool
+            count = connections
+            if isinstance(pool, AsyncAdaptedQueuePool):
+                count = min(connections, pool.size())
+
+            # Connections are held together so the pool cannot hand back the same one.
+            async with contextlib.AsyncExitStack() as stack:
+                await asyncio.gather(
+                    *(stack.enter_async_context(engine.connect()) for _ in range(count))
+                )
+
+            logger.info('Warmed up {} connections to {}.', count, engine.url)
+
+    def pool_status(self) -> list[dict[str, Any]]:
+        """
+        Reports connection pool telemetry for every engine.
+
+        Returns:
+            list[dict[str, Any]]: Role, host and pool statistics per engine.
+        """
+        if not self._engine:
+            raise Exception('Database session manager not initialized.')
+
+        engines = [('primary', self._engine, True)]
+        engines.extend(
+            ('replica', replica.engine, replica.healthy) for replica in self._replicas
+        )
+
+        status = []
+        for role, engine, healthy in engines:
+            pool = engine.sync_engine.pool
+            status.append(
+                {
+                    'role': role,
+                    'host': engine.url.host,
+                    'healthy': healthy,
+                    **(
+                        pool.status_dict()
+                        if isinstance(pool, TimedAsyncQueuePool)
+                        else {}
+                    ),
+                }
+            )
+
+        return status
+
+    async def check_replicas(self) -> None:
+        """
+        Measures the lag of every replica and updates its health.
+
+        Returns:
+            None
+        """
+        for replica in self._replicas:
+            try:
+                async with replica.engine.connect() as connection:
+                    lag = await connection.scalar(REPLICA_LAG_QUERY)
+            except (DBAPIError, OSError) as exc:
+                if replica.healthy:
+                    logger.warning(
+                        'Replica {} is unhealthy: {}', replica.engine.url, exc
+                    )
+                replica.healthy = False
+                continue
+
+            replica.lag_seconds = float(lag or 0)
+            healthy = replica.lag_seconds <= self._max_replica_lag
+
+            if healthy != replica.healthy:
+                logger.warning(
+                    'Replica {} is {} (lag {:.1f}s).',
+                    replica.engine.url,
+                    'healthy' if healthy else 'lagging',
+                    replica.lag_seconds,
+                )
+            replica.healthy = healthy
+
+    async def _run_health_checks(self) -> None:
+        while True:
+            try:
+                await self.check_replicas()
+            except Exception as exc:
+                logger.error('Replica health check failed: {}', exc)
+
+            await asyncio.sleep(self._health_check_interval)
+
+    def _pick_replica(self) -> Replica | None:
+        """
+        Picks the next healthy replica in round robin order.
+
+        Returns:
+            Replica | None: Healthy replica, None to fall back to the primary.
+        """
+        if not self._replicas or self._replica_cycle is None:
+            return None
+
+        if self._health_check_task is None:
+            self._health_check_task = asyncio.create_task(self._run_health_checks())
+
+        for _ in range(len(self._replicas)):
+            replica = next(self._replica_cycle)
+            if replica.healthy:
+                return replica
+
+        return None
 
     @contextlib.asynccontextmanager
     async def connect(self) -> AsyncIterator[AsyncConnection]:
@@ -82,10 +481,19 @@ class DatabaseSessionManager:
         # Thus, no need to handle that.
 
     @contextlib.asynccontextmanager
-    async def session(self) -> AsyncIterator[AsyncSession]:
+    async def session(
+        self, read_only: bool = False, allow_replica: bool = True
+    ) -> AsyncIterator[AsyncSession]:
         """
         Creates a session object for database.
 
+        Args:
+            read_only: Routes the session to a healthy replica when one exists,
+                the session runs in autocommit mode.
+            allow_replica: Whether a read-only session may run on a replica.
+                Reads kept in a shared cache must not come from a lagging
+                replica, they stay on the primary in autocommit mode.
+
         Returns:
             AsyncSession: Session object.
 
@@ -95,11 +503,26 @@ class DatabaseSessionManager:
         if not self._sessionmaker:
             raise Exception('Database session manager not initialized.')
 
-        session = self._sessionmaker()
+        replica = self._pick_replica() if read_only and allow_replica else None
+
+        if replica:
+            session = replica.sessionmaker()
+        elif read_only and self._read_sessionmaker:
+            session = self._read_sessionmaker()
+        else:
+            session = self._sessionmaker()
 
         try:
             yield session
-        except Exception:
+        except Exception as exc:
+            # Stop routing reads to a replica that dropped the connection
+            # until the next health check confirms it is back.
+            if replica and (
+                isinstance(exc, OSError)
+                or (isinstance(exc, DBAPIError) and exc.connection_invalidated)
+            ):
+                replica.healthy = False
+
             await session.rollback()
             raise
         finally:
@@ -134,3 +557,4 @@ class DatabaseSessionManager:
 
 
 sessionmanager = DatabaseSessionManager()
+REGISTRY.register(PoolCollector(sessionmanager.pool_status))
@@ -1,19 +1,110 @@
+import hmac
 from typing import AsyncIterable
+from fastapi import Header, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database import sessionmanager
+from src.core.config import settings
+from src.core.context import get_request_context
+from src.core.database import UnitOfWork, sessionmanager
+from src.core.exceptions.exceptions import Forbidden
 
+# Requests with these methods never write, so they can be served by a replica.
+READ_ONLY_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
 
-async def get_db() -> AsyncIterable[AsyncSession]:
+
+def _register_unit(session: AsyncSession) -> UnitOfWork:
+    """
+    Wraps a session in an unit of work known to the current request.
+
+    Args:
+        session: Session of the request.
+
+    Returns:
+        UnitOfWork: Created unit of work.
+    """
+    unit = UnitOfWork(session)
+
+    context = get_request_context()
+    if context is not None:
+        context.units.append(unit)
+
+    return unit
+
+
+async def get_db(request: Request) -> AsyncIterable[AsyncSession]:
     """
     Dependency injector async database session.
 
+    Read-only requests get a session on a replica, others on the primary.
+    The session is only bound to a connection once it runs a statement.
+
+    Args:
+        request: Incoming request.
+
     Yields:
         AsyncSession: Session instance.
     """
-    async with sessionmanager.session() as session:
+    read_only = request.method in READ_ONLY_METHODS
+
+    async with sessionmanager.session(read_only=read_only) as session:
+        unit = _register_unit(session)
         yield session
         # Only use flush operation in requests
         # Commit is called after the request is successful
         # This allows 'Unit of work' architecture
-        await session.commit()
+        # Routes using `UnitOfWorkRoute` complete it before serializing the response.
+        await unit.complete()
+
+
+async def get_read_db() -> AsyncIterable[AsyncSession]:
+    """
+    Dependency injector for a read-only database session, whatever the request method.
+
+    Yields:
+        AsyncSession: Session instance.
+    """
+    async with sessionmanager.session(read_only=True) as session:
+        unit = _register_unit(session)
+        yield session
+        await unit.complete()
+
+
+def has_internal_access(token: str | None) -> bool:
+    """
+    Checks a token against the internal API token.
+
+    Args:
+        token: Token sent by the client.
+
+    Returns:
+        bool: True when the token matches, or when no token is configured in development.
+    """
+    if settings.INTERNAL_API_TOKEN is None:
+        return settings.ENVIRONMENT == 'development'
+
+    expected = settings.INTERNAL_API_TOKEN.get_secret_value()
+    return token is not None and hmac.compare_digest(token, expected)
+
+
+def require_internal_access(
+    x_internal_token: str | None = Header(default=None),
+) -> None:
+    """
+    Dependency guarding internal endpoints.
+
+    Args:
+        x_internal_token: Token sent in the `X-Internal-Token` header.
+
+    Returns:
+        None
+
+    Raises:
+        Forbidden: When the token is missing or invalid.
+    """
+    if has_internal_access(x_internal_token):
+        return
+
+    if settings.INTERNAL_API_TOKEN is None:
+        raise Forbidden('Internal endpoints are disabled.')
+
+    raise Forbidden('Invalid internal token.')
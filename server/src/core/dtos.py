@@ -1,4 +1,8 @@
+from datetime import datetime
+from typing import Any, Self
+from pydantic_core import to_json
 from pydantic import BaseModel, ConfigDict
+from fastapi.responses import JSONResponse
 from pydantic.alias_generators import to_camel
 
 
@@ -27,3 +31,112 @@ class ResponseDto(ConfigDto):
         from_attributes=True,  # Maps ORM objects to DTO
         extra='ignore',  # Excludes extra fields
     )
+
+    @classmethod
+    def from_row(cls, row: Any) -> Self:
+        """
+        Maps a projected database row, or a trusted object with the same fields,
+        without validating its values again.
+
+        Args:
+            row: Object exposing every field of the DTO as an attribute.
+
+        Returns:
+            Self: Mapped DTO.
+        """
+        return cls.model_construct(
+            **{name: getattr(row, name) for name in cls.model_fields}
+        )
+
+
+class DtoResponse(JSONResponse):
+    """
+    JSON response rendered straight to bytes by pydantic-core.
+
+    DTOs are dumped by alias without being validated again, other content
+    is rendered like `JSONResponse` but faster.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content, by_alias=True)
+
+
+class PoolStatusDto(ResponseDto):
+    """Connection pool telemetry of one database engine."""
+
+    role: str
+    host: str | None
+    healthy: bool
+
+    size: int | None = None
+    checked_in: int | None = None
+    checked_out: int | None = None
+    overflow: int | None = None
+    checkouts: int | None = None
+    wait_seconds_total: float | None = None
+    wait_seconds_max: float | None = None
+
+
+class QueryStatsDto(ResponseDto):
+    """Execution counters of one registered query."""
+
+    name: str
+    executions: int
+    cache_hits: int
+    cache_misses: int
+
+
+class SlowQueryDto(ResponseDto):
+    """Slow executions of one normalized statement."""
+
+    fingerprint: str
+    sql: str
+    query_name: str | None
+    count: int
+    total_seconds: float
+    max_seconds: float
+    last_seen: datetime
+    last_route: str | None
+    last_parameters: str | None
+    plans: list[str]
+
+
+class ReadinessDto(ResponseDto):
+    """Readiness of the app along with its warm-up timings."""
+
+    ready: bool
+    warm_up_seconds: float | None
+    steps: dict[str, float]
+
+
+class AdmissionStatsDto(ResponseDto):
+    """Counters of one admission limiter."""
+
+    name: str
+    concurrency: int
+    max_queue: int
+    active: int
+    waiting: int
+    admitted: int
+    shed_queue_full: int
+    shed_timeout: int
+
+
+class CoalescingStatsDto(ResponseDto):
+    """Counters of one single flight."""
+
+    name: str
+    executions: int
+    coalesced: int
+    failures: int
+    in_flight: int
+
+
+class LogSinkStatsDto(ResponseDto):
+    """Counters of the JSON log sink, disabled outside of production."""
+
+    enabled: bool
+    written: int = 0
+    dropped: int = 0
+    queued: int = 0
+    batches: int = 0
@@ -33,3 +33,32 @@ class InternalServerError(HTTPException):
         super().__init__(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=detail
         )
+
+
+class TooManyRequests(HTTPException):
+    def __init__(
+        self, detail: str = 'Too Many Requests', retry_after: int | None = None
+    ) -> None:
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=detail,
+            headers=_retry_after_headers(retry_after),
+        )
+
+
+class ServiceUnavailable(HTTPException):
+    def __init__(
+        self, detail: str = 'Service Unavailable', retry_after: int | None = None
+    ) -> None:
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+            headers=_retry_after_headers(retry_after),
+        )
+
+
+def _retry_after_headers(retry_after: int | None) -> dict[str, str] | None:
+    if retry_after is None:
+        return None
+
+    return {'Retry-After': str(retry_after)}
@@ -1,9 +1,13 @@
-import traceback
+import time
+import random
+from dataclasses import dataclass
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 
 from src.core.logging import logger
+from src.core.config import settings
 from src.core.exceptions.exceptions import (
     BadRequest,
     Unauthorized,
@@ -11,6 +15,8 @@ from src.core.exceptions.exceptions import (
     NotFound,
     UnprocessableEntity,
     InternalServerError,
+    TooManyRequests,
+    ServiceUnavailable,
 )
 
 
@@ -18,6 +24,8 @@ def create_error_response(exc: Exception, status_code: int) -> JSONResponse:
     """
     Creates standard error response for given exception.
 
+    Headers set on HTTP exceptions, like `Retry-After`, are sent along.
+
     Args:
         exc: Exception to create response.
         status_code: Status code for the error response.
@@ -32,26 +40,121 @@ def create_error_response(exc: Exception, status_code: int) -> JSONResponse:
             'message': str(exc),
             'status_code': status_code,
         },
+        headers=getattr(exc, 'headers', None),
     )
 
 
-def log_exception(request: Request, exc: Exception) -> None:
+@dataclass
+class _ErrorWindow:
+    started_at: float
+    logged: int = 0
+    suppressed: int = 0
+
+
+class ErrorLogSampler:
+    """
+    Rate limits client error logs per route and error.
+
+    The first `burst` errors of a window are logged, later ones are sampled.
+    The number of dropped errors is reported with the next logged one.
+    """
+
+    def __init__(self, burst: int, window_seconds: float, sample_rate: float) -> None:
+        """
+        Constructor for error log sampler.
+
+        Args:
+            burst: Errors logged per key and window before sampling starts.
+            window_seconds: Length of a window, in seconds.
+            sample_rate: Share of the errors logged past the burst.
+
+        Returns:
+            None
+        """
+        self.burst = burst
+        self.window_seconds = window_seconds
+        self.sample_rate = sample_rate
+
+        self._windows: dict[tuple[str, str], _ErrorWindow] = {}
+
+    def sample(self, key: tuple[str, str]) -> int | None:
+        """
+        Decides whether an error is logged.
+
+        Args:
+            key: Route and error name.
+
+        Returns:
+            int | None: Errors dropped since the last logged one, None when this one is dropped.
+        """
+        now = time.monotonic()
+        window = self._windows.get(key)
+
+        if window is None or now - window.started_at >= self.window_seconds:
+            carried = window.suppressed if window else 0
+            window = self._windows[key] = _ErrorWindow(now, suppressed=carried)
+
+        if window.logged >= self.burst and random.random() >= self.sample_rate:
+            window.suppressed += 1
+            return None
+
+        window.logged += 1
+        suppressed, window.suppressed = window.suppressed, 0
+        return suppressed
+
+
+error_log_sampler = ErrorLogSampler(
+    burst=settings.ERROR_LOG_BURST,
+    window_seconds=settings.ERROR_LOG_WINDOW_SECONDS,
+    sample_rate=settings.ERROR_LOG_SAMPLE_RATE,
+)
+
+
+def log_exception(request: Request, exc: Exception, status_code: int = 500) -> None:
     """
     Logs exception.
 
+    Server errors are logged with their traceback. Client errors, and the
+    expected `ServiceUnavailable` of an overloaded dependency, are logged as a
+    compact event, rate limited per route and error.
+
     Args:
         request: Request in which the error occurred.
         exc: Exception to be logged.
+        status_code: Status code of the error response.
 
     Returns:
         None: Only logs the exception.
     """
-    logger.error(
-        f'\n--- Exception Occurred ---\n'
-        f'URL: {request.url.path}\n'
-        f'Method: {request.method}\n'
-        f'Exception: {str(exc)}\n'
-        f'Traceback:\n{traceback.format_exc()}'
+    error = exc.__class__.__name__
+
+    # Shedding load is expected, a traceback per rejected request would add to it.
+    expected = isinstance(exc, ServiceUnavailable)
+
+    if status_code >= 500 and not expected:
+        logger.opt(exception=exc).error(
+            '{} {} failed with {}: {}', request.method, request.url.path, error, exc
+        )
+        return
+
+    # Unmatched paths share a key so scanners cannot create unbounded keys.
+    route = request.scope.get('route')
+    path = getattr(route, 'path', '<unmatched>')
+
+    suppressed = error_log_sampler.sample((path, error))
+    if suppressed is None:
+        return
+
+    # Arguments are only formatted when a sink accepts the level.
+    logger.log(
+        'WARNING' if expected else 'INFO',
+        '{method} {path} -> {status_code} {error}: {detail} (suppressed={suppressed})',
+        method=request.method,
+        path=path,
+        status_code=status_code,
+        error=error,
+        detail=getattr(exc, 'detail', 'invalid request'),
+        suppressed=suppressed,
     )
 
 
@@ -68,34 +171,48 @@ def register_error_handlers(app: FastAPI) -> None:
 
     @app.exception_handler(BadRequest)
     async def handle_bad_request(request: Request, exc: BadRequest) -> JSONResponse:
-        log_exception(request, exc)
+        log_exception(request, exc, exc.status_code)
         return create_error_response(exc, exc.status_code)
 
     @app.exception_handler(Unauthorized)
     async def handle_unauthorized(request: Request, exc: Unauthorized) -> JSONResponse:
-        log_exception(request, exc)
+        log_exception(request, exc, exc.status_code)
         return create_error_response(exc, exc.status_code)
 
     @app.exception_handler(Forbidden)
     async def handle_forbidden(request: Request, exc: Forbidden) -> JSONResponse:
-        log_exception(request, exc)
+        log_exception(request, exc, exc.status_code)
         return create_error_response(exc, exc.status_code)
 
     @app.exception_handler(NotFound)
     async def handle_not_found(request: Request, exc: NotFound) -> JSONResponse:
-        log_exception(request, exc)
+        log_exception(request, exc, exc.status_code)
         return create_error_response(exc, exc.status_code)
 
     @app.exception_handler(UnprocessableEntity)
     async def handle_unprocessable_entity(
         request: Request, exc: UnprocessableEntity
     ) -> JSONResponse:
-        log_exception(request, exc)
+        log_exception(request, exc, exc.status_code)
+        return create_error_response(exc, exc.status_code)
+
+    @app.exception_handler(TooManyRequests)
+    async def handle_too_many_requests(
+        request: Request, exc: TooManyRequests
+    ) -> JSONResponse:
+        log_exception(request, exc, exc.status_code)
         return create_error_response(exc, exc.status_code)
 
     @app.exception_handler(InternalServerError)
     async def handle_internal_server_error(request: Request, exc: InternalServerError):
-        log_exception(request, exc)
+        log_exception(request, exc, exc.status_code)
+        return create_error_response(exc, exc.status_code)
+
+    @app.exception_handler(ServiceUnavailable)
+    async def handle_service_unavailable(
+        request: Request, exc: ServiceUnavailable
+    ) -> JSONResponse:
+        log_exception(request, exc, exc.status_code)
         return create_error_response(exc, exc.status_code)
 
     # This is the catch-all handler, for unhandled exceptions
@@ -115,13 +232,16 @@ def register_error_handlers(app: FastAPI) -> None:
     async def validation_exception_handler(
         request: Request, exc: RequestValidationError
     ):
-        log_exception(request, exc)
+        log_exception(request, exc, 422)
         return JSONResponse(
             status_code=422,
-            content={
-                'error': 'RequestValidationError',
-                'message': exc.errors(),
-                'body': exc.body if hasattr(exc, 'body') else None,
-                'status_code': 422,
-            },
+            # Errors of form endpoints hold the raw form data as their input.
+            content=jsonable_encoder(
+                {
+                    'error': 'RequestValidationError',
+                    'message': exc.errors(),
+                    'body': exc.body if hasattr(exc, 'body') else None,
+                    'status_code': 422,
+                }
+            ),
         )
@@ -2,6 +2,12 @@ from fastapi import FastAPI
 from contextlib import asynccontextmanager
 
 from src.core.logging import logger
+from src.core.config import settings
+from src.core.cache import close_redis
+from src.core.database import sessionmanager
+from src.core.warmup import warm_up
+from src.core.security import password_hasher
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -12,5 +18,33 @@ async def lifespan(app: FastAPI):
         app: Instantiated fastapi application.
     """
     logger.info('Starting FastAPI application...')
+
+    sessionmanager.init(
+        settings.DB_URL,
+        replica_urls=settings.DB_REPLICA_URLS,
+        max_replica_lag=settings.DB_REPLICA_MAX_LAG_SECONDS,
+        health_check_interval=settings.DB_REPLICA_HEALTH_CHECK_SECONDS,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_POOL_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args={
+            'prepared_statement_cache_size': settings.DB_STATEMENT_CACHE_SIZE
+        },
+    )
+
+    if settings.WARM_UP_ENABLED:
+        await warm_up.run(app)
+    else:
+        await sessionmanager.warm_up(settings.DB_POOL_WARMUP_CONNECTIONS)
+        warm_up.ready = True
+
     yield
+
     logger.info('Closing FastAPI application...')
+    # Fails readiness while in-flight requests drain.
+    warm_up.ready = False
+    await sessionmanager.close()
+    password_hasher.shutdown()
+    await close_redis()
@@ -1,11 +1,214 @@
 import sys
+import time
+import json
+import queue
+import atexit
+import threading
+import traceback
+from typing import Any, TextIO
 from loguru import logger
 
 from src.core.config import settings
 
-logger.add(
-    sys.stdout,
-    level=settings.LOG_LEVEL,
-    enqueue=True,
-    colorize=True,
-)
+
+class JsonLogSink:
+    """
+    Loguru sink writing records as JSON lines from a background thread.
+
+    Logging only serializes the record and puts it in a bounded queue, the
+    writer thread drains it in batches with a single write per batch. When
+    the queue is full records are dropped and counted instead of blocking the
+    caller or growing memory.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        max_queue_size: int,
+        batch_size: int,
+        flush_interval: float,
+    ) -> None:
+        """
+        Constructor for JSON log sink.
+
+        Args:
+            stream: Stream the records are written to.
+            max_queue_size: Maximum number of records waiting to be written.
+            batch_size: Maximum number of records written together.
+            flush_interval: Seconds a partial batch waits for more records.
+
+        Returns:
+            None
+        """
+        self.stream = stream
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue: queue.Queue[str | None] = queue.Queue(max_queue_size)
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name='json-log-sink', daemon=True
+        )
+        self._thread.start()
+
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+
+    def write(self, message: Any) -> None:
+        """
+        Queues a loguru message, dropping it when the queue is full.
+
+        Args:
+            message: Message of loguru, carrying its record.
+
+        Returns:
+            None
+        """
+        try:
+            self._queue.put_nowait(serialize_record(message.record))
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+
+    def stop(self) -> None:
+        """
+        Writes the queued records and stops the writer thread.
+
+        Returns:
+            None
+        """
+        if self._thread.is_alive():
+            # Blocks so the sentinel is never dropped.
+            self._queue.put(None)
+            self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            line = self._queue.get()
+            if line is None:
+                return
+
+            batch = [line]
+            deadline = time.monotonic() + self.flush_interval
+            try:
+                while len(batch) < self.batch_size:
+                    line = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                    if line is None:
+                        break
+                    batch.append(line)
+            except queue.Empty:
+                pass
+
+            self._flush(batch)
+
+            if line is None:
+                return
+
+    def _flush(self, batch: list[str]) -> None:
+        try:
+            self.stream.write('\n'.join(batch) + '\n')
+            self.stream.flush()
+        except Exception:
+            with self._lock:
+                self.dropped += len(batch)
+            return
+
+        self.written += len(batch)
+        self.batches += 1
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Returns sink counters.
+
+        Returns:
+            dict[str, Any]: Written, dropped and queued records and written batches.
+        """
+        return {
+            'written': self.written,
+            'dropped': self.dropped,
+            'queued': self._queue.qsize(),
+            'batches': self.batches,
+        }
+
+
+def serialize_record(record: dict[str, Any]) -> str:
+    """
+    Serializes a loguru record into a single JSON line.
+
+    Args:
+        record: Record of loguru.
+
+    Returns:
+        str: JSON object with the time, level, logger, message and bound fields.
+    """
+    data = {
+        'time': record['time'].isoformat(),
+        'level': record['level'].name,
+        'logger': record['name'],
+        'message': record['message'],
+        **record['extra'],
+    }
+
+    if record['exception'] is not None:
+        exc_type, exc_value, exc_traceback = record['exception']
+        data['exception'] = {
+            'type': exc_type.__name__ if exc_type else None,
+            'value': str(exc_value),
+            'traceback': ''.join(
+                traceback.format_exception(exc_type, exc_value, exc_traceback)
+            ),
+        }
+
+    return json.dumps(data, default=str)
+
+
+_configured = False
+_json_sink: JsonLogSink | None = None
+
+
+def configure_logging() -> None:
+    """
+    Registers the sinks of the environment, once per process.
+
+    Called by the app factory and the command line tools rather than at
+    import, so processes importing the modules, like alembic or tests, do not
+    start the writer threads.
+
+    Returns:
+        None
+    """
+    global _configured, _json_sink
+
+    if _configured:
+        return
+
+    _configured = True
+
+    if settings.ENVIRONMENT == 'production':
+        _json_sink = JsonLogSink(
+            sys.stdout,
+            max_queue_size=settings.LOG_QUEUE_MAX_SIZE,
+            batch_size=settings.LOG_BATCH_SIZE,
+            flush_interval=settings.LOG_FLUSH_INTERVAL_SECONDS,
+        )
+        logger.remove()
+        logger.add(_json_sink, level=settings.LOG_LEVEL, format='{message}')
+        atexit.register(logger.remove)
+    else:
+        logger.add(
+            sys.stdout,
+            level=settings.LOG_LEVEL,
+            enqueue=True,
+            colorize=True,
+        )
+
+
+def get_json_sink() -> JsonLogSink | None:
+    """
+    Returns the JSON sink, to expose its counters.
+
+    Returns:
+        JsonLogSink | None: Sink of production, None in development or before logging is configured.
+    """
+    return _json_sink
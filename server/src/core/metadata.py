@@ -3,6 +3,8 @@ from enum import Enum
 class ApiTags(str, Enum):
     auth = 'auth'
     user = 'user'
+    internal = 'internal'
+    health = 'health'
 
 title='DeMorph Server'
 version='0.0.1'
@@ -13,6 +15,8 @@ The API exposes endpoints for these services using a modular structure:
 - Auth: All authenticated related services.
 - Core: Cross-module services central to the API.
 - User: Non-authentication user services.
+- Internal: Operational endpoints for the team running the API.
+- Health: Liveness and readiness probes.
 """
 
 tags = [
@@ -23,5 +27,13 @@ tags = [
     {
         "name": ApiTags.user,
         "description": "Handles user operations such as profile management."
+    },
+    {
+        "name": ApiTags.internal,
+        "description": "Operational endpoints such as telemetry, guarded by the internal token."
+    },
+    {
+        "name": ApiTags.health,
+        "description": "Probes used by the orchestrator, readiness waits for the warm-up."
     }
 ]
\ No newline at end of file
@@ -0,0 +1,162 @@
+import functools
+from typing import Any, Callable, Iterator
+from prometheus_client import Counter, Gauge, Histogram, disable_created_metrics
+from prometheus_client.metrics import MetricWrapperBase
+from prometheus_client.registry import Collector
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+
+# `_created` series double the scrape size without being used by any query.
+disable_created_metrics()
+
+REQUEST_DURATION = Histogram(
+    'http_request_duration_seconds',
+    'Duration of HTTP requests by route template.',
+    ['method', 'route'],
+)
+REQUESTS = Counter(
+    'http_requests',
+    'HTTP requests by route template and status code.',
+    ['method', 'route', 'status_code'],
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    'http_requests_in_progress',
+    'HTTP requests being served.',
+    ['method'],
+)
+
+DB_QUERY_DURATION = Histogram(
+    'db_query_duration_seconds',
+    'Duration of database statements by registered query name.',
+    ['query'],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+PASSWORD_HASH_DURATION = Histogram(
+    'password_hash_duration_seconds',
+    'Time spent in bcrypt per password, excluding the wait for a worker.',
+    ['operation'],
+    buckets=(0.05, 0.1, 0.15, 0.2, 0.3, 0.5, 0.75, 1, 2),
+)
+
+JWT_DECODE_FAILURES = Counter(
+    'jwt_decode_failures',
+    'Tokens rejected while decoding, by reason.',
+    ['reason'],
+)
+
+ADMISSION_SHED = Counter(
+    'admission_shed',
+    'Requests rejected by admission control, by limiter and reason.',
+    ['limiter', 'reason'],
+)
+
+LOGIN_THROTTLED = Counter(
+    'login_throttled',
+    'Login attempts rejected before verifying credentials, by exceeded limit.',
+    ['limit'],
+)
+
+
+@functools.cache
+def labels(metric: MetricWrapperBase, *values: str) -> Any:
+    """
+    Returns the child of a metric for label values, cached.
+
+    `metric.labels()` validates the values and takes a lock on every call,
+    which costs as much as the observation itself on hot paths. Label values
+    must come from a bounded set, like route templates or query names.
+
+    Args:
+        metric: Labelled metric.
+        values: Label values, in the order the labels were declared.
+
+    Returns:
+        Any: Child metric for the values.
+    """
+    return metric.labels(*values)
+
+
+class PoolCollector(Collector):
+    """
+    Reports connection pool occupancy when scraped.
+
+    Reading the pools at scrape time keeps checkouts free of any metric
+    update.
+    """
+
+    def __init__(self, pool_status: Callable[[], list[dict[str, Any]]]) -> None:
+        """
+        Constructor for pool collector.
+
+        Args:
+            pool_status: Returns the telemetry of every pool, see `DatabaseSessionManager.pool_status`.
+
+        Returns:
+            None
+        """
+        self.pool_status = pool_status
+
+    def collect(self) -> Iterator[Metric]:
+        try:
+            pools = self.pool_status()
+        except Exception:
+            # The session manager is not initialized outside of the app lifespan.
+            return
+
+        labels = ['role', 'host']
+        size = GaugeMetricFamily(
+            'db_pool_size', 'Connections kept open by the pool.', labels=labels
+        )
+        checked_out = GaugeMetricFamily(
+            'db_pool_checked_out', 'Connections in use.', labels=labels
+        )
+        overflow = GaugeMetricFamily(
+            'db_pool_overflow', 'Connections open beyond the pool size.', labels=labels
+        )
+        waits = CounterMetricFamily(
+            'db_pool_wait_seconds',
+            'Time spent waiting for a connection.',
+            labels=labels,
+        )
+
+        for pool in pools:
+            if 'size' not in pool:
+                continue
+
+            values = [pool['role'], pool['host'] or '']
+            size.add_metric(values, pool['size'])
+            checked_out.add_metric(values, pool['checked_out'])
+            overflow.add_metric(values, pool['overflow'])
+            waits.add_metric(values, pool['wait_seconds_total'])
+
+        yield from (size, checked_out, overflow, waits)
+
+
+class AdmissionCollector(Collector):
+    """Reports requests served and queued per admission limiter when scraped."""
+
+    def __init__(self, limiter_stats: Callable[[], list[dict[str, Any]]]) -> None:
+        """
+        Constructor for admission collector.
+
+        Args:
+            limiter_stats: Returns the stats of every limiter, see `AdmissionLimiter.stats`.
+
+        Returns:
+            None
+        """
+        self.limiter_stats = limiter_stats
+
+    def collect(self) -> Iterator[Metric]:
+        active = GaugeMetricFamily(
+            'admission_active', 'Requests being served.', labels=['limiter']
+        )
+        waiting = GaugeMetricFamily(
+            'admission_waiting', 'Requests queued for a slot.', labels=['limiter']
+        )
+
+        for stats in self.limiter_stats():
+            active.add_metric([stats['name']], stats['active'])
+            waiting.add_metric([stats['name']], stats['waiting'])
+
+        yield from (active, waiting)
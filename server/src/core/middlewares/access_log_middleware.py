@@ -0,0 +1,93 @@
+import time
+from uuid import uuid4
+from fastapi import FastAPI
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.logging import logger
+from src.core.config import settings
+from src.core.context import RequestContext, request_context
+
+REQUEST_ID_HEADER = 'x-request-id'
+MAX_REQUEST_ID_LENGTH = 128
+
+
+def _request_id(scope: Scope) -> str:
+    # Keeps the ID given by a proxy so records can be joined across services.
+    for name, value in scope['headers']:
+        if name == REQUEST_ID_HEADER.encode():
+            request_id = value.decode('latin-1')
+            if 0 < len(request_id) <= MAX_REQUEST_ID_LENGTH:
+                return request_id
+
+    return uuid4().hex
+
+
+class AccessLogMiddleware:
+    """
+    Logs one record per request once its response has been sent.
+
+    The middleware opens the request context, so the record carries the
+    statements and database time collected by the engine and the user set by
+    authentication. The request ID is returned in the `X-Request-ID` header
+    and bound to every record logged while serving the request.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        context = RequestContext(request_id=_request_id(scope))
+        status_code = 500
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+                headers = MutableHeaders(scope=message)
+                headers.append(REQUEST_ID_HEADER, context.request_id or '')
+
+            await send(message)
+
+        token = request_context.set(context)
+        start = time.perf_counter()
+        try:
+            with logger.contextualize(request_id=context.request_id):
+                await self.app(scope, receive, send_with_request_id)
+        finally:
+            duration = time.perf_counter() - start
+            request_context.reset(token)
+
+            # The router stores the matched route in the scope, templates keep
+            # the number of distinct routes bounded.
+            route = scope.get('route')
+
+            logger.info(
+                '{method} {route} -> {status_code} in {duration_ms}ms',
+                request_id=context.request_id,
+                method=scope['method'],
+                route=getattr(route, 'path', '<unmatched>'),
+                status_code=status_code,
+                duration_ms=round(duration * 1000, 2),
+                db_ms=round(context.db_seconds * 1000, 2),
+                statements=context.statements,
+                user_id=context.user_id,
+            )
+
+
+def add(app: FastAPI) -> None:
+    """
+    Adds the access log middleware to the application.
+
+    Args:
+        app: Instantiated FastAPI application.
+
+    Returns:
+        None
+    """
+    if settings.ACCESS_LOG_ENABLED:
+        app.add_middleware(AccessLogMiddleware)
@@ -0,0 +1,113 @@
+from fastapi import FastAPI, HTTPException
+from fastapi.routing import APIRoute
+from starlette.routing import BaseRoute, Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.core.config import AdmissionLimit, settings
+from src.core.exceptions.handlers import create_error_response
+from src.core.admission import AdmissionLimiter, get_admission_limiter
+
+
+class AdmissionMiddleware:
+    """
+    Applies the admission limits of the matched route before serving it.
+
+    A route is limited by its own `METHOD /path` entry in the limits, or by
+    the first of its tags having one. Only limited routes are matched here,
+    other requests go through after a scan of those few routes.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        routes: list[BaseRoute],
+        limits: dict[str, AdmissionLimit],
+    ) -> None:
+        """
+        Constructor for admission middleware.
+
+        Args:
+            app: Wrapped application.
+            routes: Routes of the application, read on the first request once
+                every router has been included.
+            limits: Limits by route or tag.
+
+        Returns:
+            None
+        """
+        self.app = app
+        self.routes = routes
+        self.limits = limits
+
+        self._limited: list[tuple[APIRoute, AdmissionLimiter]] | None = None
+
+    def _limited_routes(self) -> list[tuple[APIRoute, AdmissionLimiter]]:
+        limited = []
+        for route in self.routes:
+            if not isinstance(route, APIRoute):
+                continue
+
+            for method in sorted(route.methods):
+                names = [f'{method} {route.path}']
+                names.extend(str(getattr(tag, 'value', tag)) for tag in route.tags)
+
+                name = next((name for name in names if name in self.limits), None)
+                if name is not None:
+                    limited.append(
+                        (route, get_admission_limiter(name, self.limits[name]))
+                    )
+                    break
+
+        return limited
+
+    def _match(self, scope: Scope) -> AdmissionLimiter | None:
+        if self._limited is None:
+            self._limited = self._limited_routes()
+
+        for route, limiter in self._limited:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return limiter
+
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        limiter = self._match(scope)
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await limiter.acquire()
+        except HTTPException as exc:
+            # Raised outside of the exception middleware, so answered here.
+            response = create_error_response(exc, exc.status_code)
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
+
+
+def add(app: FastAPI) -> None:
+    """
+    Adds the admission control middleware to the application.
+
+    Args:
+        app: Instantiated FastAPI application.
+
+    Returns:
+        None
+    """
+    if settings.ADMISSION_CONTROL_ENABLED and settings.ADMISSION_LIMITS:
+        app.add_middleware(
+            AdmissionMiddleware,
+            routes=app.router.routes,
+            limits=settings.ADMISSION_LIMITS,
+        )
@@ -0,0 +1,71 @@
+import time
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.config import settings
+from src.core.metrics import (
+    REQUESTS,
+    REQUEST_DURATION,
+    REQUESTS_IN_PROGRESS,
+    labels,
+)
+
+# Anything else is labelled `OTHER`, clients choose the method as freely as the path.
+_METHODS = frozenset(
+    {'GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS', 'CONNECT', 'TRACE'}
+)
+
+
+class MetricsMiddleware:
+    """
+    Records request counts, latencies and requests in progress.
+
+    Requests are labelled with the template of the matched route, so the
+    number of series stays bounded whatever paths clients send, and with
+    their method when it is a standard one.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        method = scope['method'] if scope['method'] in _METHODS else 'OTHER'
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+
+            await send(message)
+
+        in_progress = labels(REQUESTS_IN_PROGRESS, method)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - start
+            in_progress.dec()
+
+            route = getattr(scope.get('route'), 'path', '<unmatched>')
+            labels(REQUEST_DURATION, method, route).observe(duration)
+            labels(REQUESTS, method, route, str(status_code)).inc()
+
+
+def add(app: FastAPI) -> None:
+    """
+    Adds the metrics middleware to the application.
+
+    Args:
+        app: Instantiated FastAPI application.
+
+    Returns:
+        None
+    """
+    if settings.METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
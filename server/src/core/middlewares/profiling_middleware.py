@@ -0,0 +1,120 @@
+import time
+import random
+import asyncio
+from uuid import uuid4
+from pathlib import Path
+from typing import Any
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.core.logging import logger
+from src.core.config import settings
+from src.core.context import get_request_context
+from src.core.dependencies import has_internal_access
+
+PROFILE_HEADER = b'x-profile-token'
+
+
+def _profile_name(scope: Scope, request_id: str) -> str:
+    route = getattr(scope.get('route'), 'path', 'unmatched')
+    slug = '_'.join(part.strip('{}') for part in route.strip('/').split('/') if part)
+    return (
+        f'{time.strftime("%Y%m%dT%H%M%S")}-{scope["method"]}-{slug or "root"}'
+        f'-{request_id}.speedscope.json'
+    )
+
+
+class ProfilingMiddleware:
+    """
+    Profiles single requests with pyinstrument and saves speedscope files.
+
+    A request is profiled when it sends the internal API token in the
+    `X-Profile-Token` header, or when it is picked by the sample rate. Only
+    one request is profiled at a time, the profiler samples the whole thread.
+    """
+
+    def __init__(
+        self, app: ASGIApp, sample_rate: float, interval: float, output_dir: Path
+    ) -> None:
+        """
+        Constructor for profiling middleware.
+
+        Args:
+            app: Wrapped application.
+            sample_rate: Share of requests profiled without the header.
+            interval: Seconds between samples.
+            output_dir: Directory the profiles are saved to.
+
+        Returns:
+            None
+        """
+        self.app = app
+        self.sample_rate = sample_rate
+        self.interval = interval
+        self.output_dir = output_dir
+
+        self._active = False
+
+    def _requested(self, scope: Scope) -> bool:
+        for name, value in scope['headers']:
+            if name == PROFILE_HEADER:
+                return has_internal_access(value.decode('latin-1'))
+
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or self._active or not self._requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        # Imported on first use, the profiler is an optional dependency.
+        from pyinstrument import Profiler
+
+        self._active = True
+        profiler = Profiler(interval=self.interval, async_mode='enabled')
+        profiler.start()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profiler.stop()
+            self._active = False
+
+            context = get_request_context()
+            request_id = (context and context.request_id) or uuid4().hex
+            await self._save(profiler, _profile_name(scope, request_id))
+
+    async def _save(self, profiler: Any, name: str) -> None:
+        from pyinstrument.renderers import SpeedscopeRenderer
+
+        path = self.output_dir / name
+        try:
+            output = profiler.output(SpeedscopeRenderer())
+            await asyncio.to_thread(self._write, path, output)
+        except Exception:
+            logger.exception('Could not save profile {}.', path)
+            return
+
+        logger.info('Saved request profile to {}.', path)
+
+    def _write(self, path: Path, output: str) -> None:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        path.write_text(output)
+
+
+def add(app: FastAPI) -> None:
+    """
+    Adds the profiling middleware to the application when profiling is enabled.
+
+    Args:
+        app: Instantiated FastAPI application.
+
+    Returns:
+        None
+    """
+    if settings.PROFILING_ENABLED:
+        app.add_middleware(
+            ProfilingMiddleware,
+            sample_rate=settings.PROFILING_SAMPLE_RATE,
+            interval=settings.PROFILING_INTERVAL_SECONDS,
+            output_dir=Path(settings.PROFILING_OUTPUT_DIR),
+        )
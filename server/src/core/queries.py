@@ -0,0 +1,92 @@
+from dataclasses import dataclass
+from typing import Any, TypeVar
+from sqlalchemy.sql import Executable
+from sqlalchemy.engine.interfaces import CacheStats
+
+StatementType = TypeVar('StatementType', bound=Executable)
+
+
+@dataclass
+class QueryStats:
+    """Execution counters of one registered query."""
+
+    executions: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+
+class QueryRegistry:
+    """
+    Named statements built once at import time and reused by every call.
+
+    Reusing the same statement object skips building it and memoizes its
+    cache key, so SQLAlchemy finds the compiled SQL in its compiled cache and
+    asyncpg reuses the statement it prepared on the connection.
+    """
+
+    def __init__(self) -> None:
+        self._queries: dict[str, Executable] = {}
+        self.stats: dict[str, QueryStats] = {}
+
+    def register(self, name: str, statement: StatementType) -> StatementType:
+        """
+        Registers a statement under an unique name.
+
+        Args:
+            name: Name reported in the stats.
+            statement: Statement using bound parameters for every value.
+
+        Returns:
+            StatementType: Statement tagged with its name, to be executed by callers.
+
+        Raises:
+            ValueError: When the name is already registered.
+        """
+        if name in self._queries:
+            raise ValueError(f'Query {name} is already registered.')
+
+        tagged = statement.execution_options(query_name=name)
+        self._queries[name] = tagged
+        self.stats[name] = QueryStats()
+
+        return tagged
+
+    def record(self, context: Any) -> None:
+        """
+        Records an execution of a registered query.
+
+        Args:
+            context: Execution context of the statement.
+
+        Returns:
+            None
+        """
+        stats = self.stats.get(context.execution_options.get('query_name'))
+        if stats is None:
+            return
+
+        stats.executions += 1
+        if context.cache_hit == CacheStats.CACHE_HIT:
+            stats.cache_hits += 1
+        elif context.cache_hit == CacheStats.CACHE_MISS:
+            stats.cache_misses += 1
+
+    def stats_list(self) -> list[dict[str, Any]]:
+        """
+        Returns the counters of every registered query.
+
+        Returns:
+            list[dict[str, Any]]: Name, executions and compiled cache hits and misses.
+        """
+        return [
+            {
+                'name': name,
+                'executions': stats.executions,
+                'cache_hits': stats.cache_hits,
+                'cache_misses': stats.cache_misses,
+            }
+            for name, stats in self.stats.items()
+        ]
+
+
+query_registry = QueryRegistry()
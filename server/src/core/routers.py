@@ -0,0 +1,208 @@
+from fastapi import APIRouter, Depends, Query, Response, status
+from prometheus_client import REGISTRY, CONTENT_TYPE_LATEST, generate_latest
+
+from src.core.metadata import ApiTags
+from src.core.logging import get_json_sink
+from src.core.routing import UnitOfWorkRoute
+from src.core.queries import query_registry
+from src.core.warmup import warm_up
+from src.core.admission import admission_limiters
+from src.core.singleflight import single_flights
+from src.core.slow_queries import slow_query_log
+from src.core.dtos import (
+    DtoResponse,
+    AdmissionStatsDto,
+    PoolStatusDto,
+    QueryStatsDto,
+    ReadinessDto,
+    SlowQueryDto,
+    LogSinkStatsDto,
+    CoalescingStatsDto,
+)
+from src.core.database import sessionmanager
+from src.core.dependencies import require_internal_access
+
+router = APIRouter(
+    prefix='/internal',
+    tags=[ApiTags.internal],
+    dependencies=[Depends(require_internal_access)],
+    route_class=UnitOfWorkRoute,
+)
+
+# Probes are open, orchestrators cannot send the internal token.
+health_router = APIRouter(
+    prefix='/health',
+    tags=[ApiTags.health],
+    route_class=UnitOfWorkRoute,
+)
+
+# Served at the root, where scrapers expect it.
+metrics_router = APIRouter(
+    tags=[ApiTags.internal],
+    dependencies=[Depends(require_internal_access)],
+    route_class=UnitOfWorkRoute,
+)
+
+
+@router.get(
+    '/db/pool',
+    status_code=status.HTTP_200_OK,
+    response_model=list[PoolStatusDto],
+    response_model_by_alias=True,
+)
+async def get_pool_status_controller() -> list[PoolStatusDto]:
+    """
+    Controller to get connection pool telemetry.
+
+    Returns:
+        list[PoolStatusDto]: Checked out, idle and overflow connections and wait times per engine.
+    """
+    return [PoolStatusDto(**status) for status in sessionmanager.pool_status()]
+
+
+@router.get(
+    '/db/queries',
+    status_code=status.HTTP_200_OK,
+    response_model=list[QueryStatsDto],
+    response_model_by_alias=True,
+)
+async def get_query_stats_controller() -> list[QueryStatsDto]:
+    """
+    Controller to get registered query counters.
+
+    Returns:
+        list[QueryStatsDto]: Executions and compiled cache hits per query.
+    """
+    return [QueryStatsDto(**stats) for stats in query_registry.stats_list()]
+
+
+@router.get(
+    '/db/slow-queries',
+    status_code=status.HTTP_200_OK,
+    response_model=list[SlowQueryDto],
+    response_model_by_alias=True,
+)
+async def get_slow_queries_controller(
+    limit: int = Query(default=20, ge=1, le=200),
+) -> list[SlowQueryDto]:
+    """
+    Controller to get the slow query report.
+
+    Args:
+        limit: Maximum number of statements.
+
+    Returns:
+        list[SlowQueryDto]: Slow statements by descending total time, with their plans.
+    """
+    return [SlowQueryDto(**query) for query in slow_query_log.report(limit)]
+
+
+@router.delete('/db/slow-queries', status_code=status.HTTP_204_NO_CONTENT)
+async def clear_slow_queries_controller() -> None:
+    """
+    Controller to reset the slow query report.
+
+    Returns:
+        None
+    """
+    slow_query_log.clear()
+
+
+@router.get(
+    '/coalescing',
+    status_code=status.HTTP_200_OK,
+    response_model=list[CoalescingStatsDto],
+    response_model_by_alias=True,
+)
+async def get_coalescing_stats_controller() -> list[CoalescingStatsDto]:
+    """
+    Controller to get request coalescing counters.
+
+    Returns:
+        list[CoalescingStatsDto]: Executed and coalesced calls per single flight.
+    """
+    return [CoalescingStatsDto(**flight.stats()) for flight in single_flights]
+
+
+@router.get(
+    '/admission',
+    status_code=status.HTTP_200_OK,
+    response_model=list[AdmissionStatsDto],
+    response_model_by_alias=True,
+)
+async def get_admission_stats_controller() -> list[AdmissionStatsDto]:
+    """
+    Controller to get admission control counters.
+
+    Returns:
+        list[AdmissionStatsDto]: Requests served, queued and shed per limiter.
+    """
+    return [
+        AdmissionStatsDto(**limiter.stats()) for limiter in admission_limiters.values()
+    ]
+
+
+@router.get(
+    '/logging',
+    status_code=status.HTTP_200_OK,
+    response_model=LogSinkStatsDto,
+    response_model_by_alias=True,
+)
+async def get_log_sink_stats_controller() -> LogSinkStatsDto:
+    """
+    Controller to get JSON log sink counters.
+
+    Returns:
+        LogSinkStatsDto: Written, dropped and queued records of the sink.
+    """
+    json_sink = get_json_sink()
+    if json_sink is None:
+        return LogSinkStatsDto(enabled=False)
+
+    return LogSinkStatsDto(enabled=True, **json_sink.stats())
+
+
+@metrics_router.get('/metrics', status_code=status.HTTP_200_OK)
+async def get_metrics_controller() -> Response:
+    """
+    Controller to get metrics in the Prometheus text format.
+
+    Returns:
+        Response: Every registered metric.
+    """
+    return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
+
+
+@health_router.get('/live', status_code=status.HTTP_204_NO_CONTENT)
+async def liveness_controller() -> None:
+    """
+    Controller answering as long as the process serves requests.
+
+    Returns:
+        None
+    """
+
+
+@health_router.get(
+    '/ready',
+    status_code=status.HTTP_200_OK,
+    response_model=ReadinessDto,
+    response_model_by_alias=True,
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {'model': ReadinessDto}},
+)
+async def readiness_controller() -> DtoResponse:
+    """
+    Controller answering 200 once the warm-up is done, 503 before and while shutting down.
+
+    Returns:
+        DtoResponse: Readiness and warm-up timings.
+    """
+    readiness = ReadinessDto(
+        ready=warm_up.ready, warm_up_seconds=warm_up.seconds, steps=warm_up.steps
+    )
+    return DtoResponse(
+        readiness,
+        status_code=status.HTTP_200_OK
+        if warm_up.ready
+        else status.HTTP_503_SERVICE_UNAVAILABLE,
+    )
@@ -0,0 +1,132 @@
+import asyncio
+import functools
+from typing import Any, Callable, Coroutine
+from fastapi import Request, Response, status
+from fastapi.routing import APIRoute
+
+from src.core.logging import logger
+from src.core.config import settings
+from src.core.dtos import DtoResponse
+from src.core.context import RequestContext, request_context
+
+
+async def complete_units(context: RequestContext) -> None:
+    """
+    Completes the units of work opened by a request.
+
+    Args:
+        context: Context of the request.
+
+    Returns:
+        None
+    """
+    for unit in context.units:
+        await unit.complete()
+
+    context.units.clear()
+
+
+def _wrap_endpoint(
+    endpoint: Callable[..., Coroutine[Any, Any, Any]], route: 'UnitOfWorkRoute'
+) -> Callable[..., Coroutine[Any, Any, Any]]:
+    @functools.wraps(endpoint)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        result = await endpoint(*args, **kwargs)
+
+        context = request_context.get()
+        if context is not None:
+            await complete_units(context)
+
+        if route.renders_directly(result):
+            response = DtoResponse(
+                result, status_code=route.status_code or status.HTTP_200_OK
+            )
+
+            # Keeps what the endpoint set on an injected `Response`, like FastAPI does.
+            sub_response = next(
+                (value for value in kwargs.values() if isinstance(value, Response)),
+                None,
+            )
+            if sub_response is not None:
+                if sub_response.status_code:
+                    response.status_code = sub_response.status_code
+                response.headers.raw.extend(sub_response.headers.raw)
+
+            return response
+
+        return result
+
+    wrapper.completes_units = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+class UnitOfWorkRoute(APIRoute):
+    """
+    Route releasing its database connections as soon as the endpoint returns.
+
+    FastAPI only closes dependencies with yield after the response has been
+    serialized, this route commits and closes the sessions before that so the
+    connection is not held while building the response body.
+
+    Endpoints returning an instance of their response model are rendered by
+    `DtoResponse` directly, skipping the second validation done by FastAPI.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        # Routes are rebuilt from the wrapped endpoint when a router is included.
+        if asyncio.iscoroutinefunction(endpoint) and not getattr(
+            endpoint, 'completes_units', False
+        ):
+            endpoint = _wrap_endpoint(endpoint, self)
+
+        super().__init__(path, endpoint, **kwargs)
+
+    def renders_directly(self, result: Any) -> bool:
+        """
+        Tells whether an endpoint result can skip FastAPI serialization.
+
+        Args:
+            result: Value returned by the endpoint.
+
+        Returns:
+            bool: True when the result is exactly the response model and no
+                option changes how it is dumped.
+        """
+        return (
+            settings.DTO_RESPONSES_ENABLED
+            and type(result) is self.response_model
+            and self.response_model_by_alias
+            and not self.response_model_include
+            and not self.response_model_exclude
+            and not self.response_model_exclude_unset
+            and not self.response_model_exclude_defaults
+            and not self.response_model_exclude_none
+        )
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            # Middlewares may already have opened a context for the request.
+            context = request_context.get()
+            if context is not None:
+                context.route = self.path
+                return await handler(request)
+
+            context = RequestContext(route=self.path)
+            token = request_context.set(context)
+            try:
+                response = await handler(request)
+            finally:
+                request_context.reset(token)
+
+            logger.debug(
+                '{} {} ran {} statements in {:.1f}ms.',
+                request.method,
+                self.path,
+                context.statements,
+                context.db_seconds * 1000,
+            )
+            return response
+
+        return route_handler
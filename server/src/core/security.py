@@ -1,4 +1,15 @@
+import os
+import time
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Callable, Literal
 from passlib.context import CryptContext
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from src.core.logging import logger
+from src.core.config import settings
+from src.core.metrics import PASSWORD_HASH_DURATION
+from src.core.exceptions.exceptions import ServiceUnavailable
 
 # NOTE: These utility methods are stored here instead of `auth module
 # because they are also used by `user` module. Due to the loosely coupled
@@ -7,7 +18,260 @@ from passlib.context import CryptContext
 pwd_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
 
 
-def verify_password(password: str, hash_pw: str) -> bool:
+# Worker functions must live at module level so they can be pickled
+# and sent to the process pool.
+def _timed_verify(password: str, hash_pw: str) -> tuple[bool, float]:
+    start = time.perf_counter()
+    result = pwd_context.verify(password, hash_pw)
+    return result, time.perf_counter() - start
+
+
+def _timed_hash(password: str) -> tuple[str, float]:
+    start = time.perf_counter()
+    result = pwd_context.hash(password)
+    return result, time.perf_counter() - start
+
+
+def _load_backend() -> str:
+    return pwd_context.handler().get_backend()
+
+
+def _timed_hash_many(passwords: list[str]) -> tuple[list[str], float]:
+    start = time.perf_counter()
+    result = [pwd_context.hash(password) for password in passwords]
+    return result, time.perf_counter() - start
+
+
+@dataclass
+class HashingStats:
+    """Running timing statistics for one hashing operation."""
+
+    calls: int = 0
+    rejected: int = 0
+    compute_seconds: float = 0.0
+    wait_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+class PasswordHasher:
+    """Runs bcrypt hashing and verification off the event loop."""
+
+    def __init__(
+        self,
+        executor_type: Literal['process', 'thread'] = 'process',
+        max_workers: int | None = None,
+        max_pending: int = 64,
+        bulk_chunk_size: int = 2,
+        bulk_concurrency: int | None = None,
+    ) -> None:
+        """
+        Constructor for password hasher.
+
+        Args:
+            executor_type: Kind of pool used to run bcrypt.
+            max_workers: Size of the pool, defaults to number of CPUs.
+            max_pending: Maximum number of queued and running calls.
+            bulk_chunk_size: Passwords hashed per call by `hash_many`.
+            bulk_concurrency: Calls of `hash_many` in the pool at once,
+                defaults to half the workers.
+
+        Returns:
+            None
+        """
+        self.executor_type = executor_type
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.bulk_chunk_size = bulk_chunk_size
+        self.bulk_concurrency = bulk_concurrency or max(self.max_workers // 2, 1)
+
+        self._bulk_slots = asyncio.Semaphore(self.bulk_concurrency)
+
+        self._executor: Executor | None = None
+        self._pending = 0
+        self.stats = {'hash': HashingStats(), 'verify': HashingStats()}
+
+    @property
+    def pending(self) -> int:
+        """Number of calls currently queued or running in the pool."""
+        return self._pending
+
+    def _get_executor(self) -> Executor:
+        """
+        Lazily creates the executor so importing this module stays cheap.
+
+        Returns:
+            Executor: Pool used for hashing.
+        """
+        if self._executor is None:
+            if self.executor_type == 'process':
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix='hasher'
+                )
+
+        return self._executor
+
+    async def _run(
+        self,
+        operation: str,
+        fn: Callable[..., tuple[Any, float]],
+        *args: Any,
+        passwords: int = 1,
+    ) -> Any:
+        """
+        Submits a hashing call to the pool and records its timing.
+
+        Args:
+            operation: Name of the operation, used for stats.
+            fn: Worker function returning result and compute time.
+            args: Arguments for the worker function.
+            passwords: Number of passwords handled by the call.
+
+        Returns:
+            Any: Result of the worker function.
+
+        Raises:
+            ServiceUnavailable: When the pending queue is full.
+        """
+        stats = self.stats[operation]
+
+        if self._pending >= self.max_pending:
+            stats.rejected += 1
+            raise ServiceUnavailable(
+                'Server is busy, please try again later.', retry_after=1
+            )
+
+        self._pending += 1
+        start = time.perf_counter()
+
+        try:
+            loop = asyncio.get_running_loop()
+            result, compute_seconds = await loop.run_in_executor(
+                self._get_executor(), fn, *args
+            )
+        finally:
+            self._pending -= 1
+
+        elapsed = time.perf_counter() - start
+        stats.calls += 1
+        stats.compute_seconds += compute_seconds
+        stats.wait_seconds += max(elapsed - compute_seconds, 0.0)
+        stats.max_seconds = max(stats.max_seconds, elapsed)
+
+        histogram = PASSWORD_HASH_DURATION.labels(operation)
+        for _ in range(passwords):
+            histogram.observe(compute_seconds / passwords)
+
+        logger.debug(
+            'Password {} took {:.1f}ms ({:.1f}ms in bcrypt).',
+            operation,
+            elapsed * 1000,
+            compute_seconds * 1000,
+        )
+        return result
+
+    async def verify(self, password: str, hash_pw: str) -> bool:
+        """
+        Verifies password against a hash in the pool.
+
+        Args:
+            password: To be verified.
+            hash_pw: Hashed string.
+
+        Returns:
+            bool: True if password is valid.
+        """
+        return await self._run('verify', _timed_verify, password, hash_pw)
+
+    async def hash(self, password: str) -> str:
+        """
+        Hashes a password in the pool.
+
+        Args:
+            password: To be hashed.
+
+        Returns:
+            str: Hashed password.
+        """
+        return await self._run('hash', _timed_hash, password)
+
+    async def hash_many(self, passwords: list[str]) -> list[str]:
+        """
+        Hashes many passwords, a few at a time.
+
+        The pool is shared with logins and signups, which queue behind every
+        call already submitted. Bulk hashing is split in small chunks, with at
+        most `bulk_concurrency` of them in the pool at once, so interactive
+        calls wait for one chunk at most and keep the other workers.
+
+        Args:
+            passwords: To be hashed.
+
+        Returns:
+            list[str]: Hashed passwords, in the same order.
+        """
+        if not passwords:
+            return []
+
+        async def hash_chunk(chunk: list[str]) -> list[str]:
+            async with self._bulk_slots:
+                return await self._run(
+                    'hash', _timed_hash_many, chunk, passwords=len(chunk)
+                )
+
+        size = self.bulk_chunk_size
+        results = await asyncio.gather(
+            *(
+                hash_chunk(passwords[i : i + size])
+                for i in range(0, len(passwords), size)
+            )
+        )
+        return [hashed for chunk in results for hashed in chunk]
+
+    async def warm_up(self) -> None:
+        """
+        Starts every worker and loads the bcrypt backend in each of them.
+
+        Process workers otherwise start, import the app modules and load the
+        backend while the first logins wait.
+
+        Returns:
+            None
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+
+        # Submitted together so the pool starts a worker for each call.
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(executor, _load_backend)
+                for _ in range(self.max_workers)
+            )
+        )
+
+    def shutdown(self) -> None:
+        """
+        Shuts down the pool, waiting for running calls to finish.
+
+        Returns:
+            None
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    executor_type=settings.PASSWORD_HASHER_EXECUTOR,
+    max_workers=settings.PASSWORD_HASHER_WORKERS,
+    max_pending=settings.PASSWORD_HASHER_MAX_PENDING,
+    bulk_chunk_size=settings.PASSWORD_HASHER_BULK_CHUNK_SIZE,
+    bulk_concurrency=settings.PASSWORD_HASHER_BULK_CONCURRENCY,
+)
+
+
+async def verify_password(password: str, hash_pw: str) -> bool:
     """
     Verifies password against a hash.
 
@@ -18,10 +282,10 @@ def verify_password(password: str, hash_pw: str) -> bool:
     Returns:
         bool: True if password is valid.
     """
-    return pwd_context.verify(password, hash_pw)
+    return await password_hasher.verify(password, hash_pw)
 
 
-def hash_password(password: str) -> str:
+async def hash_password(password: str) -> str:
     """
     Hashes a password.
 
@@ -31,4 +295,4 @@ def hash_password(password: str) -> str:
     Returns:
         str: Hashed password.
     """
-    return pwd_context.hash(password)
+    return await password_hasher.hash(password)
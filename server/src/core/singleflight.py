@@ -0,0 +1,95 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Generic, Hashable, TypeVar
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class SingleFlight(Generic[K, V]):
+    """
+    Collapses concurrent calls sharing a key into a single execution.
+
+    The first caller of a key starts the call in its own task, later callers
+    await that task until it finishes. A caller being cancelled never cancels
+    the shared call, the others still get its result.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Constructor for single flight.
+
+        Args:
+            name: Name reported in the stats.
+
+        Returns:
+            None
+        """
+        self.name = name
+
+        self._calls: dict[K, asyncio.Task[V]] = {}
+
+        self.executions = 0
+        self.coalesced = 0
+        self.failures = 0
+
+        single_flights.append(self)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of shared calls currently running."""
+        return len(self._calls)
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> V:
+        """
+        Runs the call of a key, or joins the one already running.
+
+        Args:
+            key: Key identifying identical calls, usually built from their arguments.
+            fn: Call to run when none is in flight for the key.
+
+        Returns:
+            V: Result of the shared call.
+
+        Raises:
+            Exception: Whatever the shared call raised, to every caller.
+        """
+        task = self._calls.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            self.executions += 1
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.coalesced += 1
+
+        # Shielded so a cancelled caller leaves the call running for the others.
+        return await asyncio.shield(task)
+
+    def _finish(self, key: K, task: asyncio.Task[V]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+        # Retrieving the exception keeps asyncio from logging it when every
+        # caller has been cancelled.
+        if not task.cancelled() and task.exception() is not None:
+            self.failures += 1
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Returns coalescing counters.
+
+        Returns:
+            dict[str, Any]: Name, executed and coalesced calls, failures and calls in flight.
+        """
+        return {
+            'name': self.name,
+            'executions': self.executions,
+            'coalesced': self.coalesced,
+            'failures': self.failures,
+            'in_flight': self.in_flight,
+        }
+
+
+# Every single flight of the process, for telemetry.
+single_flights: list[SingleFlight] = []
@@ -0,0 +1,209 @@
+import re
+import hashlib
+from datetime import UTC, datetime
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.core.logging import logger
+from src.core.config import settings
+from src.core.context import get_request_context
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r'(?<![$\w.])\d+(?:\.\d+)?\b')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    Normalizes a statement so executions differing only by literals match.
+
+    Args:
+        statement: SQL sent to the database.
+
+    Returns:
+        str: Statement with literals replaced by `?` and whitespace collapsed.
+    """
+    statement = _STRING_LITERAL.sub('?', statement)
+    statement = _NUMBER_LITERAL.sub('?', statement)
+    return _WHITESPACE.sub(' ', statement).strip()
+
+
+def _fingerprint(value: str) -> str:
+    return hashlib.sha1(value.encode()).hexdigest()[:16]
+
+
+@dataclass
+class SlowQuery:
+    """Slow executions of one normalized statement."""
+
+    fingerprint: str
+    sql: str
+    query_name: str | None
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    last_seen: datetime | None = None
+    last_route: str | None = None
+    last_parameters: str | None = None
+    plans: list[str] = field(default_factory=list)
+
+
+class SlowQueryLog:
+    """
+    Logs statements slower than a threshold and keeps an in-memory report.
+
+    Statements are grouped by the fingerprint of their normalized SQL. The
+    first executions of each fingerprint can be explained on the same
+    connection, with `ANALYZE` for SELECT statements only so writes are never
+    run twice. Parameters are only reported as a fingerprint, they may hold
+    personal data.
+    """
+
+    def __init__(
+        self, threshold: float, explain_samples: int, max_fingerprints: int
+    ) -> None:
+        """
+        Constructor for slow query log.
+
+        Args:
+            threshold: Seconds above which a statement is slow.
+            explain_samples: Executions explained per fingerprint, 0 disables EXPLAIN.
+            max_fingerprints: Fingerprints kept in the report.
+
+        Returns:
+            None
+        """
+        self.threshold = threshold
+        self.explain_samples = explain_samples
+        self.max_fingerprints = max_fingerprints
+
+        self._queries: dict[str, SlowQuery] = {}
+
+    def record(
+        self,
+        conn: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+        elapsed: float,
+    ) -> None:
+        """
+        Records a slow execution, called from the `after_cursor_execute` event.
+
+        Args:
+            conn: Connection that ran the statement.
+            statement: SQL sent to the database.
+            parameters: Parameters of the statement.
+            context: Execution context of the statement.
+            executemany: Whether the statement ran for many parameter sets.
+            elapsed: Seconds the statement took.
+
+        Returns:
+            None
+        """
+        sql = normalize_sql(statement)
+        fingerprint = _fingerprint(sql)
+        parameters_fingerprint = _fingerprint(repr(parameters))
+
+        request = get_request_context()
+        route = request.route if request is not None else None
+
+        query = self._queries.get(fingerprint)
+        if query is None:
+            query = SlowQuery(
+                fingerprint=fingerprint,
+                sql=sql,
+                query_name=context.execution_options.get('query_name'),
+            )
+            self._add(query)
+
+        query.count += 1
+        query.total_seconds += elapsed
+        query.max_seconds = max(query.max_seconds, elapsed)
+        query.last_seen = datetime.now(UTC)
+        query.last_route = route
+        query.last_parameters = parameters_fingerprint
+
+        logger.warning(
+            'Slow query {fingerprint} took {duration_ms}ms on {route}: {sql}',
+            fingerprint=fingerprint,
+            duration_ms=round(elapsed * 1000, 2),
+            route=route or '<no route>',
+            sql=sql,
+            parameters=parameters_fingerprint,
+        )
+
+        if not executemany and len(query.plans) < self.explain_samples:
+            query.plans.append(self._explain(conn, statement, parameters))
+
+    def _add(self, query: SlowQuery) -> None:
+        if len(self._queries) >= self.max_fingerprints:
+            # Makes room by forgetting the statement that cost the least.
+            cheapest = min(self._queries.values(), key=lambda q: q.total_seconds)
+            del self._queries[cheapest.fingerprint]
+
+        self._queries[query.fingerprint] = query
+
+    def _explain(self, conn: Any, statement: str, parameters: Any) -> str:
+        explain = 'EXPLAIN'
+        if statement.lstrip()[:6].upper() == 'SELECT':
+            explain = 'EXPLAIN (ANALYZE, BUFFERS)'
+
+        dbapi_connection = conn.connection.dbapi_connection
+        # A failed EXPLAIN must not abort the transaction of the caller.
+        savepoint = not dbapi_connection.autocommit
+
+        # A new cursor keeps the rows of the original statement for its caller.
+        explain_cursor = dbapi_connection.cursor()
+        try:
+            if savepoint:
+                explain_cursor.execute('SAVEPOINT slow_query_explain')
+
+            try:
+                explain_cursor.execute(f'{explain} {statement}', parameters)
+                plan = '\n'.join(row[0] for row in explain_cursor.fetchall())
+            except Exception as exc:
+                if savepoint:
+                    explain_cursor.execute('ROLLBACK TO SAVEPOINT slow_query_explain')
+
+                logger.warning('Could not explain slow query: {}', exc)
+                return f'EXPLAIN failed: {exc}'
+
+            if savepoint:
+                explain_cursor.execute('RELEASE SAVEPOINT slow_query_explain')
+
+            return plan
+        finally:
+            explain_cursor.close()
+
+    def report(self, limit: int) -> list[dict[str, Any]]:
+        """
+        Returns the slow statements that cost the most in total.
+
+        Args:
+            limit: Maximum number of statements.
+
+        Returns:
+            list[dict[str, Any]]: Statements by descending total time.
+        """
+        queries = sorted(
+            self._queries.values(), key=lambda q: q.total_seconds, reverse=True
+        )
+        return [vars(query).copy() for query in queries[:limit]]
+
+    def clear(self) -> None:
+        """
+        Forgets every recorded statement.
+
+        Returns:
+            None
+        """
+        self._queries.clear()
+
+
+slow_query_log = SlowQueryLog(
+    threshold=settings.SLOW_QUERY_THRESHOLD_MS / 1000,
+    explain_samples=settings.SLOW_QUERY_EXPLAIN_SAMPLES,
+    max_fingerprints=settings.SLOW_QUERY_MAX_FINGERPRINTS,
+)
@@ -0,0 +1,134 @@
+import jwt
+import time
+from uuid import UUID
+from typing import Any, Awaitable, Callable
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from fastapi.dependencies.models import Dependant
+
+from src.core.logging import logger
+from src.core.config import settings
+from src.core.database import sessionmanager
+from src.core.security import password_hasher
+from src.core.dependencies import require_internal_access
+
+WARM_UP_REQUEST_ID = 'warm-up'
+
+
+class WarmUp:
+    """
+    Primes lazily built components before the app accepts traffic.
+
+    The app reports ready only once every step has run, failed steps are
+    logged and do not block readiness, the first requests only get slower.
+    """
+
+    def __init__(self) -> None:
+        self.ready = False
+        self.steps: dict[str, float] = {}
+        self.seconds: float | None = None
+
+    async def run(self, app: FastAPI) -> None:
+        """
+        Runs every warm-up step and marks the app ready.
+
+        Args:
+            app: Application being started.
+
+        Returns:
+            None
+        """
+        start = time.perf_counter()
+
+        steps: list[tuple[str, Callable[[], Awaitable[Any]]]] = [
+            (
+                'database',
+                lambda: sessionmanager.warm_up(settings.DB_POOL_WARMUP_CONNECTIONS),
+            ),
+            ('password_hasher', password_hasher.warm_up),
+            ('jwt', _warm_up_jwt),
+            ('openapi', lambda: _warm_up_openapi(app)),
+            ('routes', lambda: _warm_up_routes(app)),
+        ]
+
+        for name, step in steps:
+            step_start = time.perf_counter()
+            try:
+                await step()
+            except Exception:
+                logger.exception('Warm-up step {} failed.', name)
+
+            self.steps[name] = time.perf_counter() - step_start
+
+        self.seconds = time.perf_counter() - start
+        self.ready = True
+
+        logger.info(
+            'Warm-up finished in {:.0f}ms ({}).',
+            self.seconds * 1000,
+            ', '.join(
+                f'{name} {seconds * 1000:.0f}ms' for name, seconds in self.steps.items()
+            ),
+        )
+
+
+async def _warm_up_jwt() -> None:
+    # Imports the algorithm backend and prepares the key on first use.
+    key = settings.SECRET_KEY.get_secret_value()
+    token = jwt.encode({'sub': str(UUID(int=0))}, key, algorithm=settings.ALGORITHM)
+    jwt.decode(token, key=key, algorithms=[settings.ALGORITHM])
+
+
+async def _warm_up_openapi(app: FastAPI) -> None:
+    # Generated on the first request to the docs otherwise, then cached by the app.
+    app.openapi()
+
+
+def _is_internal(dependant: Dependant) -> bool:
+    return any(
+        dependency.call is require_internal_access or _is_internal(dependency)
+        for dependency in dependant.dependencies
+    )
+
+
+def _dummy_path(route: APIRoute) -> str:
+    values = {}
+    for param in route.dependant.path_params:
+        annotation = param.field_info.annotation
+        if annotation is UUID:
+            values[param.name] = str(UUID(int=0))
+        elif annotation is int:
+            values[param.name] = '0'
+        else:
+            values[param.name] = WARM_UP_REQUEST_ID
+
+    return route.path_format.format(**values)
+
+
+async def _warm_up_routes(app: FastAPI) -> None:
+    """
+    Sends one synthetic request per public route through the whole app.
+
+    Requests carry no credentials nor body, so they stop at authentication or
+    validation and never write. They still build the middleware stack and run
+    routing, dependency resolution, validation and the error handlers.
+    Internal routes are skipped, some of them stream or import data.
+    """
+    # Only needed once per process, keeps httpx out of the import of the app.
+    from httpx import ASGITransport, AsyncClient
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url='http://warm-up') as client:
+        for route in app.routes:
+            if not isinstance(route, APIRoute) or _is_internal(route.dependant):
+                continue
+
+            for method in sorted(route.methods):
+                await client.request(
+                    method,
+                    _dummy_path(route),
+                    headers={'X-Request-ID': WARM_UP_REQUEST_ID},
+                )
+
+
+warm_up = WarmUp()
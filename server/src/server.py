@@ -1,18 +1,23 @@
-from fastapi import FastAPI
-from typing import Optional, Callable
+"""
+Entry point of the API.
+
+Importing this module is cheap, the application and the modules it needs are
+only loaded by `create_app`. `api` is built on first access, so
+`uvicorn src.server:api` keeps working, and so does
+`uvicorn --factory src.server:create_app`.
+"""
+
+from typing import TYPE_CHECKING, Any, Optional, Callable
 from contextlib import AbstractAsyncContextManager
 
-from src.core.lifespan import lifespan
-from src.core.middlewares import cors_middleware
-from src.user.routers import router as user_router
-from src.auth.routers import router as auth_router
-from src.user.dependencies import get_user_service
-from src.auth.dependencies import get_user_provider
-from src.core.exceptions.handlers import register_error_handlers
-from src.core.metadata import title, version, description, tags
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
+# Declared without a value, so accessing it goes through `__getattr__`.
+api: 'FastAPI'
 
 
-def create_app(init_db: bool = True) -> FastAPI:
+def create_app(init_db: bool = True) -> 'FastAPI':
     """
     Factory function for FastAPI app.
 
@@ -22,6 +27,30 @@ def create_app(init_db: bool = True) -> FastAPI:
     Returns:
         FastAPI: Initialized app.
     """
+    from fastapi import FastAPI
+
+    from src.core.logging import configure_logging
+
+    # Configured first so the modules loaded below log through the app sinks.
+    configure_logging()
+
+    from src.core.lifespan import lifespan
+    from src.core.dtos import DtoResponse
+    from src.core.middlewares import (
+        cors_middleware,
+        admission_middleware,
+        metrics_middleware,
+        profiling_middleware,
+        access_log_middleware,
+    )
+    from src.core.routers import router as core_router, health_router, metrics_router
+    from src.user.routers import router as user_router
+    from src.auth.routers import router as auth_router
+    from src.user.dependencies import get_read_user_service
+    from src.auth.dependencies import get_user_provider
+    from src.core.exceptions.handlers import register_error_handlers
+    from src.core.metadata import title, version, description, tags
+
     app_lifespan: Optional[Callable[[FastAPI], AbstractAsyncContextManager[None]]] = (
         None
     )
@@ -35,18 +64,36 @@ def create_app(init_db: bool = True) -> FastAPI:
         description=description,
         openapi_tags=tags,
         lifespan=app_lifespan,
+        default_response_class=DtoResponse,
     )
 
     register_error_handlers(app)
 
+    # Inside CORS, so shed responses are readable by browsers.
+    admission_middleware.add(app)
+    profiling_middleware.add(app)
     cors_middleware.add(app)
+    metrics_middleware.add(app)
+    # Added last so the access log wraps every other middleware.
+    access_log_middleware.add(app)
 
-    app.dependency_overrides[get_user_provider] = get_user_service
+    # Authentication only reads users, so lookups can go to a replica.
+    app.dependency_overrides[get_user_provider] = get_read_user_service
 
     app.include_router(auth_router)
     app.include_router(user_router)
+    app.include_router(core_router)
+    app.include_router(metrics_router)
+    app.include_router(health_router)
 
     return app
 
 
-api = create_app()
+def __getattr__(name: str) -> Any:
+    # Builds the app on first access of `api`, then caches it as a module global.
+    if name == 'api':
+        global api
+        api = create_app()
+        return api
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
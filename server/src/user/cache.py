@@ -0,0 +1,178 @@
+from uuid import UUID
+from datetime import datetime
+
+from src.core.config import settings
+from src.user.dtos import UserInternalDto
+from src.core.cache import CacheBackend, cache_ttl, create_cache_backend
+
+# Stored for lookups that found no user, so repeated misses skip the database too.
+_NOT_FOUND = b''
+
+
+class UserCache:
+    """Read-through cache of serialized users, keyed by ID and by username."""
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        ttl: float,
+        negative_ttl: float,
+        version_ttl: float,
+    ) -> None:
+        """
+        Constructor for user cache.
+
+        Args:
+            backend: Store holding the serialized users.
+            ttl: Time to live of a cached user, in seconds.
+            negative_ttl: Time to live of a cached miss, in seconds.
+            version_ttl: Time to live of a cached profile version stamp, in seconds.
+
+        Returns:
+            None
+        """
+        self.backend = backend
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.version_ttl = version_ttl
+
+    @staticmethod
+    def _id_key(id: UUID) -> str:
+        return f'id:{id}'
+
+    @staticmethod
+    def _username_key(username: str) -> str:
+        return f'username:{username}'
+
+    @staticmethod
+    def _version_key(id: UUID) -> str:
+        return f'version:{id}'
+
+    async def _get(self, key: str) -> tuple[bool, UserInternalDto | None]:
+        """
+        Fetches a cached lookup.
+
+        Args:
+            key: Key of the lookup.
+
+        Returns:
+            tuple[bool, UserInternalDto | None]: Whether it was a hit, and the user if it exists.
+        """
+        if not settings.USER_CACHE_ENABLED:
+            return False, None
+
+        value = await self.backend.get(key)
+
+        if value is None:
+            return False, None
+
+        if value == _NOT_FOUND:
+            return True, None
+
+        return True, UserInternalDto.model_validate_json(value)
+
+    async def get_by_id(self, id: UUID) -> tuple[bool, UserInternalDto | None]:
+        return await self._get(self._id_key(id))
+
+    async def get_by_username(
+        self, username: str
+    ) -> tuple[bool, UserInternalDto | None]:
+        return await self._get(self._username_key(username))
+
+    async def set(self, user: UserInternalDto) -> None:
+        """
+        Caches an user under both of its keys.
+
+        Args:
+            user: User to cache.
+
+        Returns:
+            None
+        """
+        if not settings.USER_CACHE_ENABLED:
+            return
+
+        value = user.model_dump_json().encode()
+        await self.backend.set(self._id_key(user.id), value, self.ttl)
+        await self.backend.set(self._username_key(user.username), value, self.ttl)
+
+    async def get_version(self, id: UUID) -> datetime | None:
+        """
+        Fetches the version stamp of a profile, its `updated_at`.
+
+        Args:
+            id: ID of the user.
+
+        Returns:
+            datetime | None: Cached version stamp, None on a miss.
+        """
+        if not settings.USER_CACHE_ENABLED:
+            return None
+
+        value = await self.backend.get(self._version_key(id))
+        return datetime.fromisoformat(value.decode()) if value else None
+
+    async def set_version(self, id: UUID, updated_at: datetime) -> None:
+        if settings.USER_CACHE_ENABLED:
+            await self.backend.set(
+                self._version_key(id), updated_at.isoformat().encode(), self.version_ttl
+            )
+
+    async def set_missing_id(self, id: UUID) -> None:
+        if settings.USER_CACHE_ENABLED:
+            await self.backend.set(self._id_key(id), _NOT_FOUND, self.negative_ttl)
+
+    async def set_missing_username(self, username: str) -> None:
+        if settings.USER_CACHE_ENABLED:
+            await self.backend.set(
+                self._username_key(username), _NOT_FOUND, self.negative_ttl
+            )
+
+    async def invalidate(
+        self, id: UUID | None = None, username: str | None = None
+    ) -> None:
+        """
+        Drops cached lookups of an user.
+
+        Args:
+            id: ID of the user.
+            username: Username of the user.
+
+        Returns:
+            None
+        """
+        keys = []
+        if id is not None:
+            keys.extend((self._id_key(id), self._version_key(id)))
+        if username is not None:
+            keys.append(self._username_key(username))
+
+        if keys:
+            await self.backend.delete(*keys)
+
+    async def invalidate_usernames(self, usernames: list[str]) -> None:
+        """
+        Drops cached lookups of many usernames at once.
+
+        Args:
+            usernames: Usernames to drop.
+
+        Returns:
+            None
+        """
+        if usernames:
+            await self.backend.delete(*map(self._username_key, usernames))
+
+
+# Writes invalidate the entries of an user in every worker with the `redis`
+# backend, only in the worker that handled them with `memory`.
+user_cache = UserCache(
+    backend=create_cache_backend(
+        'user',
+        max_size=settings.USER_CACHE_MAX_SIZE,
+        ttl=cache_ttl(settings.USER_CACHE_TTL_SECONDS),
+    ),
+    ttl=cache_ttl(settings.USER_CACHE_TTL_SECONDS),
+    negative_ttl=cache_ttl(settings.USER_CACHE_NEGATIVE_TTL_SECONDS),
+    version_ttl=cache_ttl(settings.USER_VERSION_CACHE_TTL_SECONDS),
+)
@@ -0,0 +1,110 @@
+"""
+Command line tools of the user module.
+
+Usage (from `server/`, against the database configured in `.env`):
+    python -m src.user.cli import users.csv
+    python -m src.user.cli import users.ndjson --format ndjson --report report.ndjson
+"""
+
+import asyncio
+import argparse
+from pathlib import Path
+from typing import AsyncIterator
+
+from src.core.logging import logger, configure_logging
+from src.core.config import settings
+from src.core.database import sessionmanager
+from src.core.security import password_hasher
+from src.user.importer import UserImporter
+from src.user.dtos import UserImportFormatEnum
+
+CHUNK_SIZE = 64 * 1024
+
+
+async def _read_chunks(path: Path) -> AsyncIterator[bytes]:
+    """
+    Reads a file in chunks without blocking the event loop.
+
+    Args:
+        path: Path of the file.
+
+    Yields:
+        bytes: Chunks of the file.
+    """
+    with path.open('rb') as file:
+        while chunk := await asyncio.to_thread(file.read, CHUNK_SIZE):
+            yield chunk
+
+
+async def import_users(
+    path: Path, format: UserImportFormatEnum, report_path: Path
+) -> None:
+    """
+    Imports users from a file, writing the per row report as NDJSON.
+
+    Args:
+        path: Path of the CSV or NDJSON input.
+        format: Format of the input.
+        report_path: Path of the report.
+
+    Returns:
+        None
+    """
+    sessionmanager.init(settings.DB_URL, replica_urls=settings.DB_REPLICA_URLS)
+
+    created = failed = 0
+    try:
+        with report_path.open('w') as report:
+            async for row in UserImporter().run(_read_chunks(path), format):
+                report.write(row.model_dump_json(by_alias=True) + '\n')
+
+                if row.error is None:
+                    created += 1
+                else:
+                    failed += 1
+    finally:
+        await sessionmanager.close()
+        password_hasher.shutdown()
+
+    logger.info(
+        'Imported {} users, {} rows failed. Report written to {}.',
+        created,
+        failed,
+        report_path,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='User module tools.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    import_parser = commands.add_parser('import', help='Bulk import users.')
+    import_parser.add_argument('path', type=Path, help='CSV or NDJSON file.')
+    import_parser.add_argument(
+        '--format',
+        type=UserImportFormatEnum,
+        choices=list(UserImportFormatEnum),
+        metavar='{csv,ndjson}',
+        help='Format of the file, guessed from its extension by default.',
+    )
+    import_parser.add_argument(
+        '--report', type=Path, help='Report path, defaults to <path>.report.ndjson.'
+    )
+
+    args = parser.parse_args()
+    configure_logging()
+
+    if args.command == 'import':
+        format = args.format or (
+            UserImportFormatEnum.ndjson
+            if args.path.suffix in ('.ndjson', '.jsonl')
+            else UserImportFormatEnum.csv
+        )
+        report_path = args.report or args.path.with_name(
+            f'{args.path.name}.report.ndjson'
+        )
+        asyncio.run(import_users(args.path, format, report_path))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,9 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.dependencies import get_db
+from src.core.dependencies import get_db, get_read_db
 from src.user.services import UserService
+from src.user.importer import UserImporter
 
 
 def get_user_service(db: AsyncSession = Depends(get_db)) -> UserService:
@@ -16,3 +17,26 @@ def get_user_service(db: AsyncSession = Depends(get_db)) -> UserService:
         UserService: Instance of user service.
     """
     return UserService(db=db)
+
+
+def get_read_user_service(db: AsyncSession = Depends(get_read_db)) -> UserService:
+    """
+    Dependency injector for user service bound to a read-only session.
+
+    Args:
+        db: Injected read-only database session.
+
+    Returns:
+        UserService: Instance of user service.
+    """
+    return UserService(db=db)
+
+
+def get_user_importer() -> UserImporter:
+    """
+    Dependency injector for user importer.
+
+    Returns:
+        UserImporter: Instance of user importer.
+    """
+    return UserImporter()
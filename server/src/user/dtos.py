@@ -1,7 +1,9 @@
+from enum import Enum
 from uuid import UUID
 from datetime import datetime
 from pydantic import EmailStr, Field
 
+from src.core.config import settings
 from src.core.dtos import RequestDto, ResponseDto
 
 
@@ -13,6 +15,7 @@ class UserInternalDto(ResponseDto):
     first_name: str
     last_name: str | None
     password_hash: str
+    token_version: int
 
     joined_at: datetime
     updated_at: datetime
@@ -44,3 +47,41 @@ class UserUpdateDto(RequestDto):
     password: str | None = Field(
         min_length=3, max_length=8, pattern=r'^[A-Za-z\d@$!%*?&]+$', default=None
     )
+
+
+class UserBatchDto(RequestDto):
+    ids: list[UUID] = Field(min_length=1, max_length=settings.USER_BATCH_MAX_SIZE)
+
+
+class UserBatchResultDto(ResponseDto):
+    users: list[UserDto]
+    missing: list[UUID]
+
+
+class UserPageDto(ResponseDto):
+    users: list[UserDto]
+    next_cursor: str | None
+
+
+class UserSearchModeEnum(str, Enum):
+    prefix = 'prefix'
+    contains = 'contains'
+
+
+class UserImportFormatEnum(str, Enum):
+    csv = 'csv'
+    ndjson = 'ndjson'
+
+
+class UserImportRowDto(ResponseDto):
+    line: int
+    username: str | None = None
+    id: UUID | None = None
+    error: str | None = None
+
+
+class UserImportReportDto(ResponseDto):
+    created: int
+    failed: int
+    # First failed rows only, up to `USER_IMPORT_MAX_REPORTED_ERRORS`.
+    errors: list[UserImportRowDto]
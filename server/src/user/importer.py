@@ -0,0 +1,275 @@
+import csv
+import json
+from uuid import UUID, uuid4
+from typing import Any, AsyncIterable, AsyncIterator
+from pydantic import ValidationError
+from sqlalchemy import text
+
+from src.core.config import settings
+from src.user.cache import UserCache, user_cache
+from src.core.database import sessionmanager
+from src.core.security import PasswordHasher, password_hasher
+from src.core.exceptions.exceptions import BadRequest
+from src.user.dtos import UserCreateDto, UserImportRowDto, UserImportFormatEnum
+
+STAGING_TABLE = 'user_import_staging'
+STAGING_COLUMNS = [
+    'line',
+    'id',
+    'username',
+    'email',
+    'first_name',
+    'last_name',
+    'password_hash',
+]
+
+# Dropped with the transaction of each batch.
+CREATE_STAGING = text(
+    f'CREATE TEMPORARY TABLE {STAGING_TABLE} ('
+    'line integer NOT NULL, id uuid NOT NULL, username varchar(50) NOT NULL, '
+    'email varchar(254) NOT NULL, first_name varchar(50) NOT NULL, '
+    'last_name varchar(50), password_hash varchar(128) NOT NULL'
+    ') ON COMMIT DROP'
+)
+
+# Rows clashing with existing users, or with an earlier line, are skipped.
+INSERT_FROM_STAGING = text(
+    'INSERT INTO users (id, username, email, first_name, last_name, password_hash) '
+    'SELECT id, username, email, first_name, last_name, password_hash '
+    f'FROM {STAGING_TABLE} ORDER BY line '
+    'ON CONFLICT DO NOTHING RETURNING id'
+)
+
+ParsedRow = tuple[int, dict[str, Any] | None, str | None]
+
+
+async def _iter_lines(
+    chunks: AsyncIterable[bytes], max_length: int
+) -> AsyncIterator[bytes]:
+    """
+    Splits a byte stream into lines without buffering the whole stream.
+
+    Args:
+        chunks: Chunks of the input.
+        max_length: Bytes allowed in a line, so input without line breaks
+            cannot make the buffer grow unbounded.
+
+    Yields:
+        bytes: Lines without their line break.
+
+    Raises:
+        BadRequest: When a line is longer than `max_length`.
+    """
+    buffer = b''
+    number = 0
+
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b'\n')
+        for line in lines:
+            number += 1
+            if len(line) > max_length:
+                raise BadRequest(f'Line {number} is longer than {max_length} bytes.')
+
+            yield line.rstrip(b'\r')
+
+        # Rejected before the rest of the line arrives.
+        if len(buffer) > max_length:
+            raise BadRequest(f'Line {number + 1} is longer than {max_length} bytes.')
+
+    if buffer:
+        yield buffer.rstrip(b'\r')
+
+
+async def parse_rows(
+    chunks: AsyncIterable[bytes], format: UserImportFormatEnum
+) -> AsyncIterator[ParsedRow]:
+    """
+    Parses CSV or NDJSON input into rows.
+
+    CSV input starts with a header naming the `UserCreateDto` fields, quoted
+    fields cannot contain line breaks.
+
+    Args:
+        chunks: Chunks of the input.
+        format: Format of the input.
+
+    Yields:
+        ParsedRow: Line number, and the parsed row or the reason it could not be parsed.
+    """
+    header: list[str] | None = None
+    number = 0
+
+    async for raw_line in _iter_lines(chunks, settings.USER_IMPORT_MAX_LINE_BYTES):
+        number += 1
+
+        try:
+            line = raw_line.decode('utf-8-sig' if number == 1 else 'utf-8')
+        except UnicodeDecodeError:
+            yield number, None, 'Line is not valid UTF-8.'
+            continue
+
+        if not line.strip():
+            continue
+
+        if format == UserImportFormatEnum.ndjson:
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError as exc:
+                yield number, None, f'Invalid JSON: {exc.msg}.'
+                continue
+
+            if not isinstance(data, dict):
+                yield number, None, 'Line must be a JSON object.'
+                continue
+
+            yield number, data, None
+            continue
+
+        values = next(csv.reader([line]))
+
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+
+        if len(values) != len(header):
+            yield number, None, f'Expected {len(header)} columns, got {len(values)}.'
+            continue
+
+        # Empty CSV fields stand for missing optional values.
+        yield number, {key: value or None for key, value in zip(header, values)}, None
+
+
+def _format_errors(exc: ValidationError) -> str:
+    return '; '.join(
+        f'{".".join(map(str, error["loc"]))}: {error["msg"]}' for error in exc.errors()
+    )
+
+
+class UserImporter:
+    """Creates users in bulk from a streamed CSV or NDJSON file."""
+
+    def __init__(
+        self,
+        hasher: PasswordHasher = password_hasher,
+        cache: UserCache = user_cache,
+        batch_size: int = settings.USER_IMPORT_BATCH_SIZE,
+    ) -> None:
+        """
+        Constructor for user importer.
+
+        Args:
+            hasher: Hasher of the passwords of a batch, in small chunks.
+            cache: User cache, dropping cached misses of created usernames.
+            batch_size: Number of rows loaded by a single COPY.
+
+        Returns:
+            None
+        """
+        self.hasher = hasher
+        self.cache = cache
+        self.batch_size = batch_size
+
+    async def run(
+        self, chunks: AsyncIterable[bytes], format: UserImportFormatEnum
+    ) -> AsyncIterator[UserImportRowDto]:
+        """
+        Imports the users of a stream, one batch at a time.
+
+        Each batch is committed on its own, rows of committed batches stay
+        created if a later batch fails.
+
+        Args:
+            chunks: Chunks of the input.
+            format: Format of the input.
+
+        Yields:
+            UserImportRowDto: Outcome of every non blank line, in input order.
+        """
+        batch: list[ParsedRow] = []
+
+        async for row in parse_rows(chunks, format):
+            batch.append(row)
+
+            if len(batch) >= self.batch_size:
+                for result in await self._import_batch(batch):
+                    yield result
+                batch = []
+
+        if batch:
+            for result in await self._import_batch(batch):
+                yield result
+
+    async def _import_batch(self, rows: list[ParsedRow]) -> list[UserImportRowDto]:
+        """
+        Validates, hashes and loads a batch of rows.
+
+        Args:
+            rows: Parsed rows of the batch.
+
+        Returns:
+            list[UserImportRowDto]: Outcome of every row, in input order.
+        """
+        results: dict[int, UserImportRowDto] = {}
+        valid: list[tuple[int, UserCreateDto]] = []
+
+        for number, data, error in rows:
+            if data is None:
+                results[number] = UserImportRowDto(line=number, error=error)
+                continue
+
+            try:
+                valid.append((number, UserCreateDto.model_validate(data)))
+            except ValidationError as exc:
+                username = data.get('username')
+                results[number] = UserImportRowDto(
+                    line=number,
+                    username=username if isinstance(username, str) else None,
+                    error=_format_errors(exc),
+                )
+
+        hashes = await self.hasher.hash_many([dto.password for _, dto in valid])
+
+        records = [
+            (
+                number,
+                uuid4(),
+                dto.username,
+                dto.email,
+                dto.first_name.strip(),
+                dto.last_name.strip() if dto.last_name else None,
+                password_hash,
+            )
+            for (number, dto), password_hash in zip(valid, hashes)
+        ]
+
+        created: set[UUID] = set()
+        if records:
+            async with sessionmanager.connect() as connection:
+                await connection.execute(CREATE_STAGING)
+
+                raw_connection = await connection.get_raw_connection()
+                await raw_connection.driver_connection.copy_records_to_table(  # type: ignore[union-attr]
+                    STAGING_TABLE, records=records, columns=STAGING_COLUMNS
+                )
+
+                created = set((await connection.execute(INSERT_FROM_STAGING)).scalars())
+
+        for number, id, username, *_ in records:
+            if id in created:
+                results[number] = UserImportRowDto(
+                    line=number, username=username, id=id
+                )
+            else:
+                results[number] = UserImportRowDto(
+                    line=number,
+                    username=username,
+                    error='Username or email already exists.',
+                )
+
+        # Drops cached misses for the now taken usernames.
+        await self.cache.invalidate_usernames(
+            [record[2] for record in records if record[1] in created]
+        )
+
+        return [results[number] for number in sorted(results)]
@@ -1,6 +1,6 @@
 from uuid import UUID, uuid4
 from datetime import datetime
-from sqlalchemy import func, String
+from sqlalchemy import func, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import TIMESTAMP, UUID as PGUUID
 
@@ -9,6 +9,23 @@ from src.core.database import Base
 
 class User(Base):
     __tablename__ = 'users'
+    __table_args__ = (
+        # Keyset pagination order of the user listing.
+        Index('ix_users_joined_at_id', 'joined_at', 'id'),
+        # Trigram indexes serve both prefix and substring ILIKE searches.
+        Index(
+            'ix_users_username_trgm',
+            'username',
+            postgresql_using='gin',
+            postgresql_ops={'username': 'gin_trgm_ops'},
+        ),
+        Index(
+            'ix_users_email_trgm',
+            'email',
+            postgresql_using='gin',
+            postgresql_ops={'email': 'gin_trgm_ops'},
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True), primary_key=True, default=uuid4
@@ -19,6 +36,10 @@ class User(Base):
     first_name: Mapped[str] = mapped_column(String(50), nullable=False)
     last_name: Mapped[str | None] = mapped_column(String(50), nullable=True)
     password_hash: Mapped[str] = mapped_column(String(128), nullable=False)
+    # Bumped whenever previously issued tokens must stop working.
+    token_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default='0'
+    )
 
     joined_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True), server_default=func.now(), nullable=False
@@ -0,0 +1,46 @@
+from sqlalchemy import any_, bindparam, or_, select
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PGUUID
+
+from src.user.models import User
+from src.core.queries import query_registry
+from src.user.dtos import UserDto, UserInternalDto
+
+# Hot lookups of the user and auth paths, executed with their parameters,
+# e.g. `await db.execute(USER_BY_ID, {'id': id})`.
+# They select only the columns of the DTO they are mapped into, so rows skip
+# the ORM and responses other than authentication never load `password_hash`.
+
+USER_COLUMNS = tuple(getattr(User, name) for name in UserDto.model_fields)
+INTERNAL_USER_COLUMNS = tuple(
+    getattr(User, name) for name in UserInternalDto.model_fields
+)
+
+USER_BY_ID = query_registry.register(
+    'user_by_id', select(*INTERNAL_USER_COLUMNS).where(User.id == bindparam('id'))
+)
+
+USER_BY_USERNAME = query_registry.register(
+    'user_by_username',
+    select(*INTERNAL_USER_COLUMNS).where(User.username == bindparam('username')),
+)
+
+USER_PROFILE_BY_ID = query_registry.register(
+    'user_profile_by_id', select(*USER_COLUMNS).where(User.id == bindparam('id'))
+)
+
+# Duplicate check of a signup, answered by the unique indexes before hashing.
+USER_EXISTS = query_registry.register(
+    'user_exists',
+    select(User.id)
+    .where(
+        or_(User.username == bindparam('username'), User.email == bindparam('email'))
+    )
+    .limit(1),
+)
+
+USERS_BY_IDS = query_registry.register(
+    'users_by_ids',
+    select(*USER_COLUMNS).where(
+        User.id == any_(bindparam('ids', type_=ARRAY(PGUUID(as_uuid=True))))
+    ),
+)
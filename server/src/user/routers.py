@@ -1,14 +1,69 @@
 from uuid import UUID
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
 from src.core.metadata import ApiTags
+from src.core.routing import UnitOfWorkRoute
 from src.user.services import UserService
-from src.user.dependencies import get_user_service
+from src.user.importer import UserImporter
+from src.auth.interfaces import Principal
 from src.auth.dependencies import get_current_user
+from src.user.dependencies import (
+    get_user_service,
+    get_user_importer,
+    get_read_user_service,
+)
+from src.core.config import settings
+from src.core.dependencies import require_internal_access
 from src.core.exceptions.exceptions import Forbidden
-from src.user.dtos import UserDto, UserInternalDto, UserCreateDto, UserUpdateDto
+from src.user.dtos import (
+    UserDto,
+    UserBatchDto,
+    UserCreateDto,
+    UserUpdateDto,
+    UserPageDto,
+    UserBatchResultDto,
+    UserSearchModeEnum,
+    UserImportRowDto,
+    UserImportReportDto,
+    UserImportFormatEnum,
+)
+
+router = APIRouter(prefix='/users', tags=[ApiTags.user], route_class=UnitOfWorkRoute)
+
+
+async def _get_profile(
+    request: Request, response: Response, user_service: UserService, id: UUID
+) -> UserDto | Response:
+    """
+    Fetches a profile, answering 304 when the client has its current version.
+
+    The cached version stamp answers conditional requests without a lookup,
+    the profile itself is read on the session of the request.
+
+    Args:
+        request: Incoming request, possibly conditional.
+        response: Response the validators are set on.
+        user_service: Injected user service.
+        id: ID of the user.
 
-router = APIRouter(prefix='/users', tags=[ApiTags.user])
+    Returns:
+        UserDto | Response: Fetched user, or an empty 304 response.
+    """
+    version = await user_service.get_profile_version(id)
+    if version is not None:
+        validators = user_service.profile_validators(id, version)
+        if validators.is_fresh(request):
+            return validators.not_modified()
+
+    user = await user_service.get_user_profile(id)
+
+    validators = user_service.profile_validators(user.id, user.updated_at)
+    if validators.is_fresh(request):
+        return validators.not_modified()
+
+    validators.apply(response)
+    return user
 
 
 @router.get(
@@ -18,18 +73,83 @@ router = APIRouter(prefix='/users', tags=[ApiTags.user])
     response_model_by_alias=True,
 )
 async def get_current_user_controller(
-    current_user: UserInternalDto = Depends(get_current_user),
-) -> UserDto:
+    request: Request,
+    response: Response,
+    current_user: Principal = Depends(get_current_user),
+    user_service: UserService = Depends(get_user_service),
+) -> UserDto | Response:
     """
     Controller to get user.
 
+    Answers 304 when the client sends the current ETag in `If-None-Match`.
+
     Args:
+        request: Incoming request, possibly conditional.
+        response: Response the validators are set on.
         current_user: Authenticated user.
+        user_service: Injected user service.
 
     Returns:
-        UserDto: Fetched user.
+        UserDto | Response: Fetched user, or an empty 304 response.
     """
-    return UserDto.model_validate(current_user)
+    return await _get_profile(request, response, user_service, current_user.id)
+
+
+@router.get(
+    '/',
+    status_code=status.HTTP_200_OK,
+    response_model=UserPageDto,
+    response_model_by_alias=True,
+    dependencies=[Depends(require_internal_access)],
+)
+async def search_users_controller(
+    search: str | None = Query(default=None, min_length=1, max_length=254),
+    mode: UserSearchModeEnum = UserSearchModeEnum.prefix,
+    limit: int = Query(default=50, ge=1, le=settings.USER_PAGE_MAX_SIZE),
+    cursor: str | None = None,
+    user_service: UserService = Depends(get_user_service),
+) -> UserPageDto:
+    """
+    Controller to list and search users.
+
+    Args:
+        search: Text searched in username and email.
+        mode: Whether the text must prefix or be contained in the columns.
+        limit: Maximum number of users in the page.
+        cursor: Cursor returned with the previous page.
+        user_service: Injected user service.
+
+    Returns:
+        UserPageDto: Page of users, with the cursor of the next page if any.
+    """
+    return await user_service.search_users(search, mode, limit, cursor)
+
+
+@router.get(
+    '/export',
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    dependencies=[Depends(require_internal_access)],
+)
+async def export_users_controller(
+    search: str | None = Query(default=None, min_length=1, max_length=254),
+    mode: UserSearchModeEnum = UserSearchModeEnum.prefix,
+    user_service: UserService = Depends(get_user_service),
+) -> StreamingResponse:
+    """
+    Controller to export users as newline delimited JSON.
+
+    Args:
+        search: Text searched in username and email.
+        mode: Whether the text must prefix or be contained in the columns.
+        user_service: Injected user service.
+
+    Returns:
+        StreamingResponse: One user per line.
+    """
+    return StreamingResponse(
+        user_service.export_users(search, mode), media_type='application/x-ndjson'
+    )
 
 
 @router.get(
@@ -39,22 +159,51 @@ async def get_current_user_controller(
     response_model_by_alias=True,
 )
 async def get_user_controller(
+    request: Request,
+    response: Response,
     user_id: UUID,
     user_service: UserService = Depends(get_user_service),
-    _: UserInternalDto = Depends(get_current_user),
-) -> UserDto:
+    _: Principal = Depends(get_current_user),
+) -> UserDto | Response:
     """
     Controller to get user.
 
+    Answers 304 when the client sends the current ETag in `If-None-Match`.
+
     Args:
+        request: Incoming request, possibly conditional.
+        response: Response the validators are set on.
         user_id: ID of the user to fetch.
         user_service: Injected user service.
 
     Returns:
-        UserDto: Fetched user.
+        UserDto | Response: Fetched user, or an empty 304 response.
+    """
+    return await _get_profile(request, response, user_service, user_id)
+
+
+@router.post(
+    '/batch',
+    status_code=status.HTTP_200_OK,
+    response_model=UserBatchResultDto,
+    response_model_by_alias=True,
+)
+async def get_users_batch_controller(
+    batch_dto: UserBatchDto,
+    user_service: UserService = Depends(get_read_user_service),
+    _: Principal = Depends(get_current_user),
+) -> UserBatchResultDto:
+    """
+    Controller to get many users at once.
+
+    Args:
+        batch_dto: IDs of the users to fetch.
+        user_service: Injected user service, on a read-only session.
+
+    Returns:
+        UserBatchResultDto: Found users in request order, and the IDs not found.
     """
-    internal_user = await user_service.get_user(user_id)
-    return UserDto.model_validate(internal_user)
+    return await user_service.get_users(batch_dto.ids)
 
 
 @router.post(
@@ -79,6 +228,47 @@ async def create_user_controller(
     return await user_service.create_user(create_dto)
 
 
+@router.post(
+    '/import',
+    status_code=status.HTTP_200_OK,
+    response_model=UserImportReportDto,
+    response_model_by_alias=True,
+    dependencies=[Depends(require_internal_access)],
+)
+async def import_users_controller(
+    request: Request,
+    format: UserImportFormatEnum = UserImportFormatEnum.csv,
+    importer: UserImporter = Depends(get_user_importer),
+) -> UserImportReportDto:
+    """
+    Controller to create users in bulk from a CSV or NDJSON request body.
+
+    Only failed rows are kept for the report, up to a limit, so the memory
+    used does not grow with the size of the upload.
+
+    Args:
+        request: Incoming request, its body is streamed into the importer.
+        format: Format of the body.
+        importer: Injected user importer.
+
+    Returns:
+        UserImportReportDto: Counts of created and failed rows, and the first failed rows.
+    """
+    created = failed = 0
+    errors: list[UserImportRowDto] = []
+
+    async for row in importer.run(request.stream(), format):
+        if row.error is None:
+            created += 1
+            continue
+
+        failed += 1
+        if len(errors) < settings.USER_IMPORT_MAX_REPORTED_ERRORS:
+            errors.append(row)
+
+    return UserImportReportDto(created=created, failed=failed, errors=errors)
+
+
 @router.patch(
     '/{user_id}',
     status_code=status.HTTP_200_OK,
@@ -89,7 +279,7 @@ async def update_user_controller(
     user_id: UUID,
     update_dto: UserUpdateDto,
     user_service: UserService = Depends(get_user_service),
-    current_user: UserInternalDto = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> UserDto:
     """
     Controller to update user.
@@ -115,7 +305,7 @@ async def update_user_controller(
 async def delete_user_controller(
     user_id: UUID,
     user_service: UserService = Depends(get_user_service),
-    current_user: UserInternalDto = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> None:
     """
     Controller to delete an user.
@@ -1,20 +1,80 @@
 from uuid import UUID
-from sqlalchemy import select, or_
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable
+from sqlalchemy import Select, or_, select, tuple_, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import insert
 
 from src.user.models import User
+from src.user.cache import UserCache, user_cache
+from src.core.config import settings
+from src.core.database import after_commit, sessionmanager
+from src.core.singleflight import SingleFlight
+from src.user.utils import decode_cursor, encode_cursor, escape_like
+from src.user.queries import (
+    USER_COLUMNS,
+    USER_BY_ID,
+    USER_BY_USERNAME,
+    USERS_BY_IDS,
+    USER_EXISTS,
+    USER_PROFILE_BY_ID,
+)
+from src.core.cache import token_cache, token_versions
 from src.core.security import hash_password
+from src.core.conditional import Validators
 from src.core.exceptions.exceptions import NotFound, BadRequest
-from src.user.dtos import UserDto, UserInternalDto, UserCreateDto, UserUpdateDto
+from src.user.dtos import (
+    UserDto,
+    UserInternalDto,
+    UserCreateDto,
+    UserUpdateDto,
+    UserPageDto,
+    UserBatchResultDto,
+    UserSearchModeEnum,
+)
+
+
+def _search_query(search: str | None, mode: UserSearchModeEnum) -> Select:
+    """
+    Builds the listing query, ordered on the `(joined_at, id)` keyset.
+
+    Args:
+        search: Text searched in username and email.
+        mode: Whether the text must prefix or be contained in the columns.
+
+    Returns:
+        Select: Listing query.
+    """
+    query = select(*USER_COLUMNS).order_by(User.joined_at, User.id)
+
+    if search:
+        pattern = escape_like(search)
+        pattern = f'{pattern}%' if mode == UserSearchModeEnum.prefix else f'%{pattern}%'
+        query = query.where(
+            or_(
+                User.username.ilike(pattern, escape='\\'),
+                User.email.ilike(pattern, escape='\\'),
+            )
+        )
+
+    return query
+
+
+# Coalesces lookups of the same user, e.g. a client reconnecting many
+# requests at once with the same token.
+user_lookups: SingleFlight[tuple[str, Any], UserInternalDto | None] = SingleFlight(
+    'user_lookups'
+)
 
 
 class UserService:
     """Service class that handles user management logic."""
 
-    def __init__(self, db: AsyncSession) -> None:
+    def __init__(self, db: AsyncSession, cache: UserCache = user_cache) -> None:
         self.db = db
+        self.cache = cache
 
-    async def _get_by_id(self, id: UUID) -> User:
+    async def _get_by_id(self, id: UUID) -> UserDto:
         """
         Private helper to fetch user by ID.
 
@@ -22,18 +82,72 @@ class UserService:
             id: ID of the user.
 
         Returns:
-            User: Fetched user.
+            UserDto: Fetched user.
 
         Raises:
             NotFound: When user is not found.
         """
-        query = select(User).where(User.id == id)
-        user = await self.db.scalar(query)
+        row = (await self.db.execute(USER_PROFILE_BY_ID, {'id': id})).one_or_none()
 
-        if not user:
+        if not row:
             raise NotFound('User not found.')
 
-        return user
+        return UserDto.from_row(row)
+
+    async def _forget(self, id: UUID, username: str, token_version: int | None) -> None:
+        """
+        Private helper dropping the cached state of a changed user, once committed.
+
+        Args:
+            id: ID of the user.
+            username: Username of the user.
+            token_version: Minimum token version accepted from now on, None to keep tokens.
+
+        Returns:
+            None
+        """
+        # Bumped first, so tokens cached while the user cache is invalidated are rejected.
+        if token_version is not None:
+            await token_versions.set(str(id), token_version)
+
+        token_cache.invalidate_tag(str(id))
+        await self.cache.invalidate(id=id, username=username)
+
+    async def _load_user(
+        self,
+        query: Select,
+        params: dict[str, Any],
+        set_missing: Callable[[], Awaitable[None]],
+    ) -> UserInternalDto | None:
+        """
+        Private helper loading an user for concurrent identical lookups.
+
+        The lookup is shared with other requests, so it runs on its own read
+        session instead of the session of the request that started it. The
+        user is cached, so it is read from the primary, a lagging replica
+        would cache a row older than the writes just committed.
+
+        Args:
+            query: Registered lookup query.
+            params: Parameters of the query.
+            set_missing: Caches the miss when no user is found.
+
+        Returns:
+            UserInternalDto | None: Loaded user, None when not found.
+        """
+        async with sessionmanager.session(
+            read_only=True, allow_replica=False
+        ) as session:
+            row = (await session.execute(query, params)).one_or_none()
+
+        if not row:
+            await set_missing()
+            return None
+
+        internal_user = UserInternalDto.from_row(row)
+        await self.cache.set(internal_user)
+
+        return internal_user
 
     async def get_user(self, id: UUID) -> UserInternalDto:
         """
@@ -44,9 +158,27 @@ class UserService:
 
         Returns:
             UserInternalDto: Fetched user.
+
+        Raises:
+            NotFound: When user is not found.
         """
-        user = await self._get_by_id(id)
-        return UserInternalDto.model_validate(user)
+        hit, cached_user = await self.cache.get_by_id(id)
+        if hit:
+            if cached_user is None:
+                raise NotFound('User not found.')
+            return cached_user
+
+        internal_user = await user_lookups.do(
+            ('id', id),
+            lambda: self._load_user(
+                USER_BY_ID, {'id': id}, lambda: self.cache.set_missing_id(id)
+            ),
+        )
+
+        if internal_user is None:
+            raise NotFound('User not found.')
+
+        return internal_user
 
     async def get_user_by_username(self, username: str) -> UserInternalDto:
         """
@@ -57,14 +189,171 @@ class UserService:
 
         Returns:
             UserInternalDto: Fetched user.
+
+        Raises:
+            NotFound: When user is not found.
         """
-        query = select(User).where(User.username == username)
-        user = await self.db.scalar(query)
+        hit, cached_user = await self.cache.get_by_username(username)
+        if hit:
+            if cached_user is None:
+                raise NotFound('User not found.')
+            return cached_user
+
+        internal_user = await user_lookups.do(
+            ('username', username),
+            lambda: self._load_user(
+                USER_BY_USERNAME,
+                {'username': username},
+                lambda: self.cache.set_missing_username(username),
+            ),
+        )
 
-        if not user:
+        if internal_user is None:
             raise NotFound('User not found.')
 
-        return UserInternalDto.model_validate(user)
+        return internal_user
+
+    async def get_profile_version(self, id: UUID) -> datetime | None:
+        """
+        Fetches the cached version stamp of the public profile of an user.
+
+        Args:
+            id: ID of the user.
+
+        Returns:
+            datetime | None: Last modification time of the profile, None when not cached.
+        """
+        return await self.cache.get_version(id)
+
+    async def get_user_profile(self, id: UUID) -> UserDto:
+        """
+        Fetches the public profile of an user by ID, caching its version stamp.
+
+        Args:
+            id: ID of the user to fetch.
+
+        Returns:
+            UserDto: Fetched user.
+
+        Raises:
+            NotFound: When user is not found.
+        """
+        user = await self._get_by_id(id)
+
+        # Lets conditional requests skip the lookup until the user changes.
+        await self.cache.set_version(id, user.updated_at)
+
+        return user
+
+    @staticmethod
+    def profile_validators(id: UUID, updated_at: datetime) -> Validators:
+        """
+        Derives the validators of the public profile of an user.
+
+        Args:
+            id: ID of the user.
+            updated_at: Version stamp of the profile.
+
+        Returns:
+            Validators: ETag and last modification time of the profile.
+        """
+        return Validators.from_version(updated_at, id, tuple(UserDto.model_fields))
+
+    async def get_users(self, ids: list[UUID]) -> UserBatchResultDto:
+        """
+        Fetches many users by ID with a single query.
+
+        Args:
+            ids: IDs of the users to fetch, duplicates are resolved once.
+
+        Returns:
+            UserBatchResultDto: Found users in request order, and the IDs not found.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+
+        rows = await self.db.execute(USERS_BY_IDS, {'ids': unique_ids})
+        users_by_id = {row.id: UserDto.from_row(row) for row in rows}
+
+        return UserBatchResultDto(
+            users=[users_by_id[id] for id in unique_ids if id in users_by_id],
+            missing=[id for id in unique_ids if id not in users_by_id],
+        )
+
+    async def search_users(
+        self,
+        search: str | None = None,
+        mode: UserSearchModeEnum = UserSearchModeEnum.prefix,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> UserPageDto:
+        """
+        Lists users a page at a time, continuing after the cursor.
+
+        Args:
+            search: Text searched in username and email.
+            mode: Whether the text must prefix or be contained in the columns.
+            limit: Maximum number of users in the page.
+            cursor: Cursor returned with the previous page.
+
+        Returns:
+            UserPageDto: Page of users, with the cursor of the next page if any.
+
+        Raises:
+            BadRequest: When the cursor is malformed.
+        """
+        query = _search_query(search, mode)
+
+        if cursor:
+            joined_at, id = decode_cursor(cursor)
+            query = query.where(tuple_(User.joined_at, User.id) > (joined_at, id))
+
+        # One extra row tells whether there is a next page.
+        rows = (await self.db.execute(query.limit(limit + 1))).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].joined_at, rows[-1].id)
+
+        return UserPageDto(
+            users=[UserDto.from_row(row) for row in rows],
+            next_cursor=next_cursor,
+        )
+
+    async def export_users(
+        self,
+        search: str | None = None,
+        mode: UserSearchModeEnum = UserSearchModeEnum.prefix,
+    ) -> AsyncIterator[bytes]:
+        """
+        Streams users as newline delimited JSON from a server-side cursor.
+
+        The export opens its own session because the request session is
+        released before the response body is streamed.
+
+        Args:
+            search: Text searched in username and email.
+            mode: Whether the text must prefix or be contained in the columns.
+
+        Yields:
+            bytes: One serialized user per line.
+        """
+        query = _search_query(search, mode).execution_options(
+            yield_per=settings.USER_EXPORT_BATCH_SIZE
+        )
+
+        async with sessionmanager.session(read_only=True) as session:
+            # Cursors need a transaction, which also gives a consistent snapshot.
+            await session.connection(
+                execution_options={'isolation_level': 'REPEATABLE READ'}
+            )
+
+            rows = await session.stream(query)
+            async for row in rows:
+                yield (
+                    UserDto.from_row(row).model_dump_json(by_alias=True).encode()
+                    + b'\n'
+                )
 
     async def create_user(self, create_dto: UserCreateDto) -> UserDto:
         """
@@ -75,29 +364,48 @@ class UserService:
 
         Returns:
             UserDto: Created user.
+
+        Raises:
+            BadRequest: When username or email already exists.
         """
-        query = select(User).where(
-            or_(User.username == create_dto.username, User.email == create_dto.email)
+        # Rejects most duplicates before paying for a bcrypt hash.
+        exists = (
+            await self.db.execute(
+                USER_EXISTS,
+                {'username': create_dto.username, 'email': create_dto.email},
+            )
+        ).first()
+
+        if exists:
+            raise BadRequest('Username or email already exists.')
+
+        hashed_pw = await hash_password(create_dto.password)
+
+        # Concurrent signups are still caught by the insert, which checks
+        # duplicates, inserts and reads back in a single statement.
+        query = (
+            insert(User)
+            .values(
+                username=create_dto.username,
+                email=create_dto.email,
+                first_name=create_dto.first_name.strip(),
+                last_name=create_dto.last_name.strip()
+                if create_dto.last_name
+                else None,
+                password_hash=hashed_pw,
+            )
+            .on_conflict_do_nothing()
+            .returning(*USER_COLUMNS)
         )
-        existing_user = await self.db.scalar(query)
+        row = (await self.db.execute(query)).one_or_none()
 
-        if existing_user:
+        if not row:
             raise BadRequest('Username or email already exists.')
 
-        hashed_pw = hash_password(create_dto.password)
+        # Drops a cached miss for the now taken username.
+        after_commit(self.db, lambda: self.cache.invalidate(username=row.username))
 
-        user = User(
-            username=create_dto.username,
-            email=create_dto.email,
-            first_name=create_dto.first_name.strip(),
-            last_name=create_dto.last_name.strip() if create_dto.last_name else None,
-            password_hash=hashed_pw,
-        )
-        self.db.add(user)
-        await self.db.flush()
-        await self.db.refresh(user)
-
-        return UserDto.model_validate(user)
+        return UserDto.from_row(row)
 
     async def update_user(self, id: UUID, update_dto: UserUpdateDto) -> UserDto:
         """
@@ -109,21 +417,39 @@ class UserService:
 
         Returns:
             UserDto: Updated user.
+
+        Raises:
+            NotFound: When user is not found.
         """
-        user = await self._get_by_id(id)
+        values: dict[str, Any] = update_dto.model_dump(
+            exclude_unset=True, exclude={'password'}
+        )
 
         if update_dto.password:
-            hashed_pw = hash_password(update_dto.password)
-            user.password_hash = hashed_pw
+            values['password_hash'] = await hash_password(update_dto.password)
+            # Tokens issued before the password change are no longer accepted.
+            values['token_version'] = User.token_version + 1
+
+        if not values:
+            return await self._get_by_id(id)
+
+        query = (
+            update(User)
+            .where(User.id == id)
+            .values(**values)
+            .returning(*USER_COLUMNS, User.token_version)
+            .execution_options(synchronize_session=False)
+        )
+        row = (await self.db.execute(query)).one_or_none()
 
-        update_dict = update_dto.model_dump(exclude_unset=True, exclude={'password'})
-        for key, value in update_dict.items():
-            setattr(user, key, value)
+        if not row:
+            raise NotFound('User not found.')
 
-        await self.db.flush()
-        await self.db.refresh(user)
+        # Tokens issued before a password change are rejected from now on.
+        token_version = row.token_version if update_dto.password else None
+        after_commit(self.db, lambda: self._forget(id, row.username, token_version))
 
-        return UserDto.model_validate(user)
+        return UserDto.from_row(row)
 
     async def delete_user(self, id: UUID) -> None:
         """
@@ -134,7 +460,22 @@ class UserService:
 
         Returns:
             None
+
+        Raises:
+            NotFound: When user is not found.
         """
-        user = await self._get_by_id(id)
-        await self.db.delete(user)
-        await self.db.flush()
+        query = (
+            delete(User)
+            .where(User.id == id)
+            .returning(User.username, User.token_version)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = (await self.db.execute(query)).one_or_none()
+
+        if not deleted:
+            raise NotFound('User not found.')
+
+        after_commit(
+            self.db,
+            lambda: self._forget(id, deleted.username, deleted.token_version + 1),
+        )
@@ -0,0 +1,56 @@
+import json
+import base64
+import binascii
+from uuid import UUID
+from datetime import datetime
+
+from src.core.exceptions.exceptions import BadRequest
+
+
+def encode_cursor(joined_at: datetime, id: UUID) -> str:
+    """
+    Encodes the position of an user in the listing order into an opaque cursor.
+
+    Args:
+        joined_at: Join date of the last user of a page.
+        id: ID of the last user of a page.
+
+    Returns:
+        str: URL safe cursor.
+    """
+    raw = json.dumps([joined_at.isoformat(), str(id)], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decodes a cursor created by `encode_cursor`.
+
+    Args:
+        cursor: Cursor sent by the client.
+
+    Returns:
+        tuple[datetime, UUID]: Join date and ID to continue after.
+
+    Raises:
+        BadRequest: When the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        joined_at, id = json.loads(raw)
+        return datetime.fromisoformat(joined_at), UUID(id)
+    except (binascii.Error, ValueError, TypeError):
+        raise BadRequest('Invalid cursor.')
+
+
+def escape_like(value: str) -> str:
+    """
+    Escapes the wildcards of a LIKE pattern, using backslash as escape character.
+
+    Args:
+        value: Searched text.
+
+    Returns:
+        str: Text matching itself literally.
+    """
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')